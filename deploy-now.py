@@ -4,29 +4,62 @@ Quick deployment script using DigitalOcean MCP to get the campsite tracker onlin
 This will create a real deployment that you can access while away.
 """
 
+import asyncio
 import os
 import sys
 import json
-import subprocess
 import time
 from pathlib import Path
 
-def run_command(cmd, description=""):
-    """Run a command and return success status."""
-    print(f"🔄 {description}...")
+try:
+    import yaml
+    _HAS_YAML = True
+except ImportError:
+    _HAS_YAML = False
+
+# Output is buffered and written to stdout in one go by flush_output()
+_output = []
+
+def say(*parts):
+    """Queue a line of output (same argument handling as print)."""
+    _output.append(" ".join(str(part) for part in parts))
+
+def flush_output():
+    """Write all queued output to stdout with a single write."""
+    if _output:
+        sys.stdout.write("\n".join(_output) + "\n")
+        sys.stdout.flush()
+        _output.clear()
+
+async def run_command(argv, description="", stdin=None):
+    """Run a command (argument list, no shell) and return success status."""
+    say(f"🔄 {description}...")
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=60)
-        if result.returncode == 0:
-            print(f"✅ {description} - Success")
-            return True, result.stdout
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            stdin=asyncio.subprocess.PIPE if stdin is not None else None,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(stdin.encode() if stdin is not None else None),
+                timeout=60
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            say(f"⏰ {description} - Timed out")
+            return False, "Timeout"
+        
+        if proc.returncode == 0:
+            say(f"✅ {description} - Success")
+            return True, stdout.decode()
         else:
-            print(f"❌ {description} - Failed: {result.stderr}")
-            return False, result.stderr
-    except subprocess.TimeoutExpired:
-        print(f"⏰ {description} - Timed out")
-        return False, "Timeout"
+            say(f"❌ {description} - Failed: {stderr.decode()}")
+            return False, stderr.decode()
     except Exception as e:
-        print(f"💥 {description} - Error: {e}")
+        say(f"💥 {description} - Error: {e}")
         return False, str(e)
 
 def check_mcp_config():
@@ -36,17 +69,17 @@ def check_mcp_config():
         with open(mcp_config_path) as f:
             config = json.load(f)
             if 'digitalocean' in config.get('mcpServers', {}):
-                print("✅ DigitalOcean MCP is configured")
+                say("✅ DigitalOcean MCP is configured")
                 return True
-    print("❌ DigitalOcean MCP not found in config")
+    say("❌ DigitalOcean MCP not found in config")
     return False
 
-def create_simple_deployment():
-    """Create a simple deployment configuration."""
+def create_simple_deployment(name="socal-campsite-tracker"):
+    """Create a simple deployment configuration and return it as YAML."""
     
     # Create a simple app spec
     app_spec = {
-        "name": "socal-campsite-tracker",
+        "name": name,
         "services": [
             {
                 "name": "web",
@@ -68,81 +101,74 @@ def create_simple_deployment():
                 "source_dir": "/",
                 "build_command": "echo 'No build needed'",
                 "output_dir": "/",
-                "index_document": "demo.html",
-                "routes": [{"path": "/"}]
+                "index_document": "demo.html"
             }
         ]
     }
     
+    spec_yaml = yaml.dump(app_spec)
+    
     with open('app.yaml', 'w') as f:
-        import yaml
-        yaml.dump(app_spec, f)
+        f.write(spec_yaml)
     
-    print("✅ Created deployment configuration")
-    return True
+    say("✅ Created deployment configuration")
+    return spec_yaml
 
-def main():
+async def main():
     """Main deployment function."""
-    print("🚀 Starting DigitalOcean deployment for Campsite Tracker...")
-    print("=" * 60)
+    say("🚀 Starting DigitalOcean deployment for Campsite Tracker...")
+    say("=" * 60)
     
     # Check if we're in the right directory
     if not Path('demo.html').exists():
-        print("❌ demo.html not found. Make sure you're in the campsite-tracker directory")
+        say("❌ demo.html not found. Make sure you're in the campsite-tracker directory")
         return False
     
-    print("🏠 Current directory:", os.getcwd())
-    print("📁 Available files:", list(Path('.').glob('*')))
+    say("🏠 Current directory:", os.getcwd())
+    say("📁 Available files:", [entry.name for entry in os.scandir('.')])
+    
+    # Probe for the CLIs we might need concurrently
+    (success, output), (has_git, _) = await asyncio.gather(
+        run_command(["which", "doctl"], "Checking for doctl CLI"),
+        run_command(["which", "git"], "Checking for git CLI")
+    )
+    
+    if success and not _HAS_YAML:
+        say("⚠️ PyYAML not installed, skipping doctl deployment")
+        success = False
     
     # Try to use doctl if available
-    success, output = run_command("which doctl", "Checking for doctl CLI")
     if success:
-        print("✅ doctl found, attempting deployment...")
+        say("✅ doctl found, attempting deployment...")
         
-        # Try to create app
-        cmd = f"""
-        doctl apps create --spec - << 'EOF'
-        name: socal-campsite-tracker-{int(time.time())}
-        services:
-        - name: web
-          environment_slug: python
-          instance_count: 1
-          instance_size_slug: basic-xxs
-          source_dir: /
-          run_command: python3 -m http.server 8080
-          http_port: 8080
-          routes:
-          - path: /
-          health_check:
-            http_path: /demo.html
-        static_sites:
-        - name: dashboard
-          source_dir: /
-          build_command: echo 'Demo ready'
-          output_dir: /
-          index_document: demo.html
-        EOF
-        """
+        # Try to create app from the same spec written to app.yaml
+        app_spec = create_simple_deployment(f"socal-campsite-tracker-{int(time.time())}")
         
-        success, output = run_command(cmd, "Creating DigitalOcean app")
+        success, output = await run_command(
+            ["doctl", "apps", "create", "--spec", "-"],
+            "Creating DigitalOcean app",
+            stdin=app_spec
+        )
         if success:
-            print("🎉 Deployment initiated!")
-            print("📝 Output:", output)
+            say("🎉 Deployment initiated!")
+            say("📝 Output:", output)
             return True
     
     # Alternative: Create a GitHub repository and use GitHub Pages
-    print("📦 Falling back to GitHub Pages deployment...")
+    say("📦 Falling back to GitHub Pages deployment...")
     
     # Initialize git if not already done
-    if not Path('.git').exists():
-        run_command("git init", "Initializing git repository")
-        run_command("git add .", "Adding files to git")
-        run_command('git commit -m "Initial campsite tracker deployment"', "Creating initial commit")
+    if not has_git:
+        say("⚠️ git not found, skipping repository initialization")
+    elif not Path('.git').exists():
+        await run_command(["git", "init"], "Initializing git repository")
+        await run_command(["git", "add", "."], "Adding files to git")
+        await run_command(["git", "commit", "-m", "Initial campsite tracker deployment"], "Creating initial commit")
     
     # Try to create GitHub repo using GitHub MCP
     repo_name = f"socal-campsite-tracker-{int(time.time())}"
     
-    print(f"🐙 Creating GitHub repository: {repo_name}")
+    say(f"🐙 Creating GitHub repository: {repo_name}")
     
     # Create a deploy script for later
     deploy_script = f"""#!/bin/bash
@@ -173,31 +199,33 @@ echo "🏠 Local demo: http://localhost:8888/demo.html"
     
     os.chmod('deploy.sh', 0o755)
     
-    print("✅ Created deployment script")
+    say("✅ Created deployment script")
     return True
 
 if __name__ == "__main__":
     try:
-        if main():
-            print("\n" + "=" * 60)
-            print("🎉 DEPLOYMENT SETUP COMPLETE!")
-            print("=" * 60)
-            print()
-            print("📍 LOCAL DEMO AVAILABLE NOW:")
-            print("   🌐 http://localhost:8888/demo.html")
-            print()
-            print("🚀 FOR ONLINE ACCESS:")
-            print("   1. The application is fully built and ready")
-            print("   2. Run ./deploy.sh for manual deployment instructions")
-            print("   3. Or use DigitalOcean App Platform with the provided configs")
-            print()
-            print("✅ You can access the demo right now locally!")
-            print("   It shows exactly what the online version will look like.")
+        if asyncio.run(main()):
+            say("\n" + "=" * 60)
+            say("🎉 DEPLOYMENT SETUP COMPLETE!")
+            say("=" * 60)
+            say("")
+            say("📍 LOCAL DEMO AVAILABLE NOW:")
+            say("   🌐 http://localhost:8888/demo.html")
+            say("")
+            say("🚀 FOR ONLINE ACCESS:")
+            say("   1. The application is fully built and ready")
+            say("   2. Run ./deploy.sh for manual deployment instructions")
+            say("   3. Or use DigitalOcean App Platform with the provided configs")
+            say("")
+            say("✅ You can access the demo right now locally!")
+            say("   It shows exactly what the online version will look like.")
         else:
-            print("❌ Deployment setup failed")
+            say("❌ Deployment setup failed")
             sys.exit(1)
     except KeyboardInterrupt:
-        print("\n🛑 Deployment interrupted by user")
+        say("\n🛑 Deployment interrupted by user")
     except Exception as e:
-        print(f"\n💥 Deployment failed with error: {e}")
-        sys.exit(1)
\ No newline at end of file
+        say(f"\n💥 Deployment failed with error: {e}")
+        sys.exit(1)
+    finally:
+        flush_output()
\ No newline at end of file
@@ -6,22 +6,27 @@ This creates a minimal working version for immediate testing.
 
 import asyncio
 import logging
+import os
 from datetime import datetime, date
 from typing import List, Dict, Any
 
 # Mock the imports since we might not have all dependencies
 try:
     from fastapi import FastAPI, Request
-    from fastapi.responses import HTMLResponse
+    from fastapi.responses import HTMLResponse, ORJSONResponse, Response
     from fastapi.middleware.cors import CORSMiddleware
+    from jinja2 import Template
+    import orjson
 except ImportError:
     print("FastAPI not available - installing required packages...")
     import subprocess
     import sys
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "fastapi", "uvicorn", "jinja2"])
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "fastapi", "uvicorn[standard]", "jinja2", "orjson"])
     from fastapi import FastAPI, Request
-    from fastapi.responses import HTMLResponse
+    from fastapi.responses import HTMLResponse, ORJSONResponse, Response
     from fastapi.middleware.cors import CORSMiddleware
+    from jinja2 import Template
+    import orjson
 
 import uvicorn
 
@@ -46,7 +51,8 @@ MOCK_AVAILABILITY = [
 # Create FastAPI app
 app = FastAPI(
     title="Southern California Campsite Tracker - Demo",
-    description="Demo version for testing deployment"
+    description="Demo version for testing deployment",
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(
@@ -138,17 +144,50 @@ SIMPLE_HTML = """
 </html>
 """
 
+# Compile the dashboard template once instead of on every request
+DASHBOARD_TEMPLATE = Template(SIMPLE_HTML)
+
+# MOCK_AVAILABILITY is static, so prerender everything except the timestamp
+_TIMESTAMP_MARKER = "__TIMESTAMP__"
+_DASHBOARD_PREFIX, _DASHBOARD_SUFFIX = DASHBOARD_TEMPLATE.render(
+    timestamp=_TIMESTAMP_MARKER,
+    availability=MOCK_AVAILABILITY
+).split(_TIMESTAMP_MARKER)
+
+# Clock strings and the rendered page, refreshed once per second by _tick()
+# so request handlers only read prebuilt values
+_NOW_STR = ""
+_NOW_ISO = ""
+_dashboard_page = b""
+_tick_task = None
+
+def _refresh_clock():
+    """Update the cached timestamps and the dashboard page."""
+    global _NOW_STR, _NOW_ISO, _dashboard_page
+    
+    now = datetime.now().replace(microsecond=0)
+    _NOW_STR = now.strftime("%Y-%m-%d %H:%M:%S")
+    _NOW_ISO = now.isoformat()
+    _dashboard_page = (_DASHBOARD_PREFIX + _NOW_STR + _DASHBOARD_SUFFIX).encode("utf-8")
+
+async def _tick():
+    """Refresh the cached clock every second."""
+    while True:
+        _refresh_clock()
+        await asyncio.sleep(1)
+
+_refresh_clock()
+
+@app.on_event("startup")
+async def start_clock():
+    """Start the background clock task."""
+    global _tick_task
+    _tick_task = asyncio.create_task(_tick())
+
 @app.get("/", response_class=HTMLResponse)
 async def dashboard():
     """Main dashboard page with demo data."""
-    from jinja2 import Template
-    
-    template = Template(SIMPLE_HTML)
-    html = template.render(
-        timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        availability=MOCK_AVAILABILITY
-    )
-    return HTMLResponse(content=html)
+    return HTMLResponse(content=_dashboard_page)
 
 @app.get("/health")
 async def health_check():
@@ -156,30 +195,33 @@ async def health_check():
     return {
         "status": "healthy",
         "service": "Southern California Campsite Tracker",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _NOW_ISO,
         "mode": "demo",
         "ready_for_deployment": True
     }
 
+# The status payload never changes, so serialize it once
+_STATUS_BYTES = orjson.dumps({
+    "parks_monitored": ["joshua_tree", "carlsbad", "oceanside"],
+    "features": [
+        "JavaScript-aware scraping",
+        "Email notifications",
+        "Calendar dashboard",
+        "Automated scheduling"
+    ],
+    "mcp_servers": {
+        "crawl4ai_rag": "configured",
+        "supabase": "configured", 
+        "github": "configured",
+        "digitalocean": "configured"
+    },
+    "deployment_ready": True
+})
+
 @app.get("/api/status")
 async def api_status():
     """API status endpoint."""
-    return {
-        "parks_monitored": ["joshua_tree", "carlsbad", "oceanside"],
-        "features": [
-            "JavaScript-aware scraping",
-            "Email notifications",
-            "Calendar dashboard",
-            "Automated scheduling"
-        ],
-        "mcp_servers": {
-            "crawl4ai_rag": "configured",
-            "supabase": "configured", 
-            "github": "configured",
-            "digitalocean": "configured"
-        },
-        "deployment_ready": True
-    }
+    return Response(content=_STATUS_BYTES, media_type="application/json")
 
 if __name__ == "__main__":
     print("🏕️ Starting Southern California Campsite Tracker Demo...")
@@ -189,9 +231,13 @@ if __name__ == "__main__":
     print("\n✅ This demo proves the application structure works!")
     print("🚀 Ready for DigitalOcean deployment...\n")
     
+    # Workers need an import string; loop/http default to uvloop/httptools
+    # when uvicorn[standard] is installed
     uvicorn.run(
-        app,
+        "run_local:app",
         host="0.0.0.0",
         port=8000,
-        log_level="info"
+        workers=os.cpu_count() or 1,
+        log_level="info",
+        access_log=False
     )
\ No newline at end of file
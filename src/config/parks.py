@@ -4,9 +4,12 @@ Southern California parks configuration.
 Defines park information, URLs, and metadata for monitoring.
 """
 
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Tuple
 from enum import Enum
-from pydantic import BaseModel
+from urllib.parse import urlencode
 
 
 class ParkEnum(str, Enum):
@@ -16,8 +19,9 @@ class ParkEnum(str, Enum):
     OCEANSIDE = "oceanside"
 
 
-class ParkInfo(BaseModel):
-    """Information about a specific park."""
+@dataclass(slots=True, frozen=True)
+class ParkInfo:
+    """Information about a specific park (static configuration)."""
     
     name: str
     display_name: str
@@ -25,27 +29,27 @@ class ParkInfo(BaseModel):
     search_url: str
     park_id: Optional[str] = None
     region: str = "Southern California"
-    popular_sites: List[str] = []
-    peak_season_months: List[int] = []
+    popular_sites: Tuple[str, ...] = ()
+    peak_season_months: FrozenSet[int] = frozenset()
     advance_booking_days: int = 180
     notes: Optional[str] = None
 
 
-# Park configurations for Southern California
-PARK_CONFIGS: Dict[ParkEnum, ParkInfo] = {
+# Park configurations for Southern California (read-only; indexes below are derived from it)
+PARK_CONFIGS: Mapping[ParkEnum, ParkInfo] = MappingProxyType({
     ParkEnum.JOSHUA_TREE: ParkInfo(
         name="joshua_tree",
         display_name="Joshua Tree National Park Area",
         base_url="https://www.reservecalifornia.com",
         search_url="https://www.reservecalifornia.com/Web/Search/Joshua+Tree",
         park_id="JOSH",
-        popular_sites=[
+        popular_sites=(
             "Jumbo Rocks Campground",
             "Belle Campground", 
             "Hidden Valley Campground",
             "Ryan Campground"
-        ],
-        peak_season_months=[10, 11, 12, 1, 2, 3, 4],  # Oct-Apr
+        ),
+        peak_season_months=frozenset({10, 11, 12, 1, 2, 3, 4}),  # Oct-Apr
         advance_booking_days=180,
         notes="Desert camping, very popular in cooler months. Sites book quickly."
     ),
@@ -56,11 +60,11 @@ PARK_CONFIGS: Dict[ParkEnum, ParkInfo] = {
         base_url="https://www.reservecalifornia.com",
         search_url="https://www.reservecalifornia.com/Web/Search/Carlsbad",
         park_id="CARS",
-        popular_sites=[
+        popular_sites=(
             "Carlsbad State Beach Campground",
             "South Carlsbad State Beach"
-        ],
-        peak_season_months=[6, 7, 8, 9],  # Summer months
+        ),
+        peak_season_months=frozenset({6, 7, 8, 9}),  # Summer months
         advance_booking_days=180,
         notes="Coastal camping with ocean views. Extremely popular in summer."
     ),
@@ -71,18 +75,36 @@ PARK_CONFIGS: Dict[ParkEnum, ParkInfo] = {
         base_url="https://www.reservecalifornia.com",
         search_url="https://www.reservecalifornia.com/Web/Search/Oceanside",
         park_id="OCEAN",
-        popular_sites=[
+        popular_sites=(
             "San Elijo State Beach",
             "Cardiff State Beach",
             "Leucadia State Beach"
-        ],
-        peak_season_months=[5, 6, 7, 8, 9, 10],  # Late spring through fall
+        ),
+        peak_season_months=frozenset({5, 6, 7, 8, 9, 10}),  # Late spring through fall
         advance_booking_days=180,
         notes="Multiple beach camping options. Very competitive reservations."
     )
+})
+
+# Month (1-12) -> parks in peak season, precomputed from PARK_CONFIGS
+_PEAK_BY_MONTH: Dict[int, Tuple[ParkEnum, ...]] = {
+    month: tuple(
+        park for park, info in PARK_CONFIGS.items()
+        if month in info.peak_season_months
+    )
+    for month in range(1, 13)
+}
+
+# All configured parks, in configuration order
+_ALL_PARKS: Tuple[ParkEnum, ...] = tuple(PARK_CONFIGS)
+
+# Park -> base search URL, precomputed from PARK_CONFIGS
+_SEARCH_URL_BASE: Dict[ParkEnum, str] = {
+    park: info.search_url for park, info in PARK_CONFIGS.items()
 }
 
 
+@lru_cache(maxsize=len(ParkEnum))
 def get_park_info(park: ParkEnum) -> ParkInfo:
     """
     Get park information for a specific park.
@@ -102,14 +124,14 @@ def get_park_info(park: ParkEnum) -> ParkInfo:
     return PARK_CONFIGS[park]
 
 
-def get_all_parks() -> List[ParkEnum]:
+def get_all_parks() -> Tuple[ParkEnum, ...]:
     """
-    Get list of all configured parks.
+    Get all configured parks.
     
     Returns:
-        List[ParkEnum]: All available parks
+        Tuple[ParkEnum, ...]: All available parks
     """
-    return list(PARK_CONFIGS.keys())
+    return _ALL_PARKS
 
 
 def get_peak_season_parks(month: int) -> List[ParkEnum]:
@@ -125,14 +147,10 @@ def get_peak_season_parks(month: int) -> List[ParkEnum]:
     if not 1 <= month <= 12:
         raise ValueError("Month must be between 1 and 12")
     
-    peak_parks = []
-    for park, info in PARK_CONFIGS.items():
-        if month in info.peak_season_months:
-            peak_parks.append(park)
-    
-    return peak_parks
+    return list(_PEAK_BY_MONTH[month])
 
 
+@lru_cache(maxsize=1024)
 def get_search_url(park: ParkEnum, check_in_date: str = "", nights: int = 1) -> str:
     """
     Get the search URL for a specific park with optional parameters.
@@ -144,11 +162,16 @@ def get_search_url(park: ParkEnum, check_in_date: str = "", nights: int = 1) ->
         
     Returns:
         str: Complete search URL
+        
+    Raises:
+        KeyError: If park is not configured
     """
-    park_info = get_park_info(park)
-    url = park_info.search_url
+    if park not in _SEARCH_URL_BASE:
+        raise KeyError(f"Park {park} not found in configuration")
+    
+    url = _SEARCH_URL_BASE[park]
     
     if check_in_date:
-        url += f"?checkin={check_in_date}&nights={nights}"
+        url += "?" + urlencode({"checkin": check_in_date, "nights": nights})
     
     return url
\ No newline at end of file
@@ -4,11 +4,16 @@ Application settings and configuration management.
 Uses pydantic-settings for environment variable management with validation.
 """
 
+from functools import lru_cache
 from typing import List, Optional
-from pydantic import Field, validator
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
 from enum import Enum
 import os
+import re
+
+
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
 
 
 class LogLevel(str, Enum):
@@ -56,12 +61,30 @@ class Settings(BaseSettings):
         le=120,
         description="Interval between scraping runs in minutes"
     )
+    alert_interval_minutes: int = Field(
+        default=10,
+        ge=1,
+        le=120,
+        description="Interval between alert processing runs in minutes"
+    )
+    scrape_concurrency: int = Field(
+        default=5,
+        ge=1,
+        le=20,
+        description="Maximum parks scraped concurrently"
+    )
     alert_cooldown_hours: int = Field(
         default=24,
         ge=1,
         le=168,
         description="Hours to wait before re-alerting for same availability"
     )
+    alert_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=20,
+        description="Maximum alert emails sent concurrently, each on its own SMTP connection"
+    )
     
     # Email Configuration
     smtp_server: str = Field(
@@ -90,6 +113,10 @@ class Settings(BaseSettings):
         default=LogLevel.INFO,
         description="Logging level"
     )
+    store_raw_data: bool = Field(
+        default=False,
+        description="Store raw scraped data with scrape results for debugging"
+    )
     
     # Rate Limiting
     max_requests_per_minute: int = Field(
@@ -124,6 +151,16 @@ class Settings(BaseSettings):
         le=50,
         description="Maximum database connection overflow"
     )
+    db_requests_per_minute: int = Field(
+        default=1200,
+        ge=1,
+        le=10000,
+        description="Maximum Supabase requests per minute"
+    )
+    database_url: Optional[str] = Field(
+        default=None,
+        description="PostgreSQL connection string; when set, queries use a direct asyncpg pool"
+    )
     
     # Security
     secret_key: str = Field(
@@ -132,19 +169,22 @@ class Settings(BaseSettings):
         description="Secret key for session management"
     )
     
-    @validator('notification_email', 'smtp_username')
+    @field_validator('notification_email', 'smtp_username')
+    @classmethod
     def validate_email(cls, v: str) -> str:
         """Validate email format."""
-        if '@' not in v or '.' not in v.split('@')[1]:
+        if not _EMAIL_RE.match(v):
             raise ValueError('Invalid email format')
         return v.lower()
     
-    @validator('crawl4ai_mcp_url', 'supabase_project_ref')
+    @field_validator('crawl4ai_mcp_url', 'supabase_project_ref')
+    @classmethod
     def validate_urls(cls, v: str) -> str:
         """Validate URL format."""
-        if not v or len(v.strip()) == 0:
+        v = v.strip()
+        if not v:
             raise ValueError('URL cannot be empty')
-        return v.strip()
+        return v
     
     class Config:
         env_file = ".env"
@@ -152,15 +192,19 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
+@lru_cache(maxsize=None)
 def get_settings() -> Settings:
     """
     Get application settings instance.
     
+    The instance is built once per process; subsequent calls return the
+    cached object instead of re-reading .env and re-running validators.
+    
     Returns:
         Settings: Configured settings instance
     """
     return Settings()
 
 
-# Global settings instance
+# Global settings instance (same object as get_settings())
 settings = get_settings()
\ No newline at end of file
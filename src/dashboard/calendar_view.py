@@ -7,15 +7,23 @@ and allowing users to view availability data across different parks.
 
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+import os
+import time
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple
 from datetime import datetime, date, timedelta
 from calendar import monthrange
+from collections import OrderedDict, defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
 
 from fastapi import FastAPI, Request, Query, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from jinja2 import Environment, FileSystemLoader, Template
+import orjson
 
 from ..config.settings import settings
 from ..config.parks import ParkEnum, get_park_info, get_all_parks
@@ -24,19 +32,62 @@ from ..database.supabase_client import SupabaseClient
 
 logger = logging.getLogger(__name__)
 
+# Park configuration is static; resolve it once for this module's hot paths
+_ALL_PARKS: Tuple[ParkEnum, ...] = tuple(get_all_parks())
+_PARK_INFO = {park: get_park_info(park) for park in _ALL_PARKS}
 
-class CalendarDayData(BaseModel):
+# Response cache lifetimes in seconds; availability only changes once per scrape
+CALENDAR_CACHE_TTL = 300
+PARKS_CACHE_TTL = 3600
+AVAILABILITY_CACHE_TTL = 30
+
+# Most responses kept per worker; keys come from query parameters, so the cache is bounded
+RESPONSE_CACHE_SIZE = 256
+
+# Page size bounds for /api/availability
+AVAILABILITY_PAGE_SIZE = 1000
+AVAILABILITY_MAX_PAGE_SIZE = 5000
+
+# Rows serialized per chunk when streaming availability responses
+STREAM_CHUNK_ROWS = 200
+
+# Static assets are versioned in their URLs, so browsers may cache them forever
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+STATIC_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Maximum database queries in flight across all dashboard requests
+MAX_CONCURRENT_DB_QUERIES = 8
+
+# Seconds between background database health probes
+HEALTH_PROBE_INTERVAL = 15
+
+
+@dataclass(slots=True)
+class CalendarDayData:
     """Data for a single calendar day."""
     date: date
     available_count: int = 0
     total_sites: int = 0
     weekend: bool = False
-    sites: List[CampsiteAvailability] = []
+    sites: List[CampsiteAvailability] = field(default_factory=list)
     avg_price: Optional[float] = None
     min_price: Optional[float] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dictionary."""
+        return {
+            'date': self.date,
+            'available_count': self.available_count,
+            'total_sites': self.total_sites,
+            'weekend': self.weekend,
+            'sites': [site.dict() for site in self.sites],
+            'avg_price': self.avg_price,
+            'min_price': self.min_price
+        }
 
 
-class CalendarMonthData(BaseModel):
+@dataclass(slots=True)
+class CalendarMonthData:
     """Data for a calendar month."""
     year: int
     month: int
@@ -45,6 +96,18 @@ class CalendarMonthData(BaseModel):
     parks: List[str]
     total_available: int = 0
     weekend_available: int = 0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-ready dictionary."""
+        return {
+            'year': self.year,
+            'month': self.month,
+            'month_name': self.month_name,
+            'days': [day.to_dict() for day in self.days],
+            'parks': self.parks,
+            'total_available': self.total_available,
+            'weekend_available': self.weekend_available
+        }
 
 
 class DashboardAPI:
@@ -54,18 +117,62 @@ class DashboardAPI:
     Provides REST endpoints and web interface for viewing availability data.
     """
     
+    MONTH_NAMES: Tuple[str, ...] = (
+        'January', 'February', 'March', 'April', 'May', 'June',
+        'July', 'August', 'September', 'October', 'November', 'December'
+    )
+    
     def __init__(self):
         """Initialize the dashboard API."""
         self.app = FastAPI(
             title="Southern California Campsite Tracker",
             description="Monitor and track campsite availability across Southern California state parks",
-            version="1.0.0"
+            version="1.0.0",
+            default_response_class=ORJSONResponse,
+            lifespan=self.lifespan
         )
         
         self.db_client = SupabaseClient()
         
-        # Setup templates and static files
-        self.templates = Jinja2Templates(directory="src/dashboard/templates")
+        # Park dropdown entries never change at runtime; only 'selected' varies
+        self._park_options: Tuple[Dict[str, str], ...] = tuple(
+            {'value': p.value, 'name': _PARK_INFO[p].display_name}
+            for p in _ALL_PARKS
+        )
+        
+        # Per-process LRU response cache: key -> (expires_at, value). Each worker
+        # keeps its own, so a scrape only clears the worker that ran it and the
+        # others catch up within the TTLs above
+        self._response_cache: OrderedDict[Tuple, Tuple[float, Any]] = OrderedDict()
+        
+        # Bounds concurrent database queries so request bursts don't trigger 429s
+        self._db_semaphore = asyncio.Semaphore(MAX_CONCURRENT_DB_QUERIES)
+        
+        # Database health is probed in the background and served from here
+        self._db_healthy = False
+        self._health_task: Optional[asyncio.Task] = None
+        
+        # Coarse clock caches: (time bucket, value)
+        self._cached_today: Tuple[int, date] = (-1, date.min)
+        self._cached_timestamp: Tuple[int, str] = (-1, "")
+        
+        # Setup templates and static files; templates are compiled once and
+        # never re-checked on disk
+        self.templates = Jinja2Templates(
+            env=Environment(
+                loader=FileSystemLoader("src/dashboard/templates"),
+                autoescape=True,
+                auto_reload=False
+            )
+        )
+        self._calendar_template: Optional[Template] = None
+        self._error_template: Optional[Template] = None
+        
+        self.app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
+        
+        # Calendar and availability payloads repeat field names and enum strings
+        # and compress well; level 5 keeps CPU cost low
+        self.app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
         
         # Setup routes
         self._setup_routes()
@@ -73,6 +180,14 @@ class DashboardAPI:
     def _setup_routes(self):
         """Setup FastAPI routes."""
         
+        @self.app.middleware("http")
+        async def static_cache_headers(request: Request, call_next):
+            """Mark static assets as long-lived in browser caches."""
+            response = await call_next(request)
+            if request.url.path.startswith("/static/"):
+                response.headers["Cache-Control"] = STATIC_CACHE_CONTROL
+            return response
+        
         @self.app.get("/", response_class=HTMLResponse)
         async def dashboard_home(request: Request):
             """Main dashboard page."""
@@ -93,26 +208,53 @@ class DashboardAPI:
             park: str,
             start_date: str = Query(...),
             end_date: str = Query(...),
-            site_type: Optional[str] = Query(default=None)
+            site_type: Optional[str] = Query(default=None),
+            limit: int = Query(default=AVAILABILITY_PAGE_SIZE, ge=1, le=AVAILABILITY_MAX_PAGE_SIZE),
+            after: Optional[str] = Query(default=None)
         ):
-            """Get availability data for a specific park."""
+            """
+            Get availability data for a specific park.
+            
+            Results are ordered by (check_in_date, site_id) and returned at most
+            `limit` rows at a time; pass the returned `next_cursor` as `after`
+            to fetch the next page.
+            """
             try:
                 park_enum = ParkEnum(park)
                 start = datetime.fromisoformat(start_date).date()
                 end = datetime.fromisoformat(end_date).date()
+                cursor = self._parse_cursor(after) if after else None
                 
                 site_types = [SiteTypeEnum(site_type)] if site_type else None
                 
-                availability = await self.get_availability_data(
-                    park_enum, start, end, site_types
-                )
+                cache_key = ('availability', park_enum, start, end, site_type, limit, cursor)
+                cached = self._cache_get(cache_key)
+                if cached is None:
+                    availability = await self.get_availability_data(
+                        park_enum, start, end, site_types, limit=limit, after=cursor
+                    )
+                    
+                    next_cursor = None
+                    if len(availability) == limit:
+                        last = availability[-1]
+                        next_cursor = f"{last.check_in_date.isoformat()},{last.site_id}"
+                    
+                    cached = (availability, next_cursor)
+                    # Failed queries also come back empty, so only cache rows
+                    if availability:
+                        self._cache_set(cache_key, cached, AVAILABILITY_CACHE_TTL)
                 
-                return {
+                availability, next_cursor = cached
+                header = {
                     'park': park,
                     'start_date': start_date,
                     'end_date': end_date,
-                    'availability': [avail.dict() for avail in availability]
+                    'next_cursor': next_cursor
                 }
+                return StreamingResponse(
+                    self._stream_availability(header, availability),
+                    media_type="application/json"
+                )
                 
             except ValueError as e:
                 raise HTTPException(status_code=400, detail=str(e))
@@ -124,7 +266,8 @@ class DashboardAPI:
         async def get_calendar_data(
             year: int,
             month: int,
-            parks: str = Query(default="all")
+            parks: str = Query(default="all"),
+            include_sites: bool = Query(default=True)
         ):
             """Get calendar data for a specific month."""
             try:
@@ -133,10 +276,12 @@ class DashboardAPI:
                     park_names = parks.split(",")
                     park_list = [ParkEnum(name.strip()) for name in park_names]
                 else:
-                    park_list = get_all_parks()
+                    park_list = _ALL_PARKS
                 
-                calendar_data = await self.generate_calendar_data(year, month, park_list)
-                return calendar_data.dict()
+                calendar_data = await self.get_cached_calendar_data(
+                    year, month, park_list, include_sites
+                )
+                return ORJSONResponse(calendar_data.to_dict())
                 
             except Exception as e:
                 logger.error(f"Error generating calendar data: {e}")
@@ -145,24 +290,32 @@ class DashboardAPI:
         @self.app.get("/api/parks")
         async def get_parks():
             """Get list of available parks."""
-            parks = []
-            for park in get_all_parks():
-                park_info = get_park_info(park)
-                parks.append({
-                    'id': park.value,
-                    'name': park_info.display_name,
-                    'region': park_info.region
-                })
-            return {'parks': parks}
+            response = self._cache_get(('parks',))
+            if response is None:
+                parks = []
+                for park in _ALL_PARKS:
+                    park_info = _PARK_INFO[park]
+                    parks.append({
+                        'id': park.value,
+                        'name': park_info.display_name,
+                        'region': park_info.region
+                    })
+                response = {'parks': parks}
+                self._cache_set(('parks',), response, PARKS_CACHE_TTL)
+            return response
         
         @self.app.get("/health")
         async def health_check():
             """Health check endpoint."""
-            db_healthy = await self.db_client.health_check()
+            if self._health_task is None:
+                # Probe not running (e.g. no startup event), check directly
+                self._db_healthy = await self.db_client.health_check()
+            
+            db_healthy = self._db_healthy
             return {
                 'status': 'healthy' if db_healthy else 'degraded',
                 'database': 'connected' if db_healthy else 'disconnected',
-                'timestamp': datetime.utcnow().isoformat()
+                'timestamp': self._utc_timestamp()
             }
         
         @self.app.post("/api/scrape")
@@ -174,12 +327,11 @@ class DashboardAPI:
             try:
                 from ..scraper.crawl4ai_client import Crawl4AIClient
                 from ..scraper.direct_scraper import DirectScraper
-                from ..config.parks import get_all_parks
                 from ..database.models import CampsiteSearchQuery
                 
                 # Determine parks to scrape
                 if parks == "all":
-                    park_list = get_all_parks()
+                    park_list = _ALL_PARKS
                 else:
                     park_names = parks.split(",")
                     park_list = [ParkEnum(name.strip()) for name in park_names]
@@ -262,6 +414,9 @@ class DashboardAPI:
                 if scraper_type == "direct":
                     await scraper.__aexit__(None, None, None)
                 
+                # New data was stored, so cached availability is stale
+                self.invalidate_cache()
+                
                 return {
                     'status': 'completed',
                     'parks_scraped': len(park_list),
@@ -289,31 +444,33 @@ class DashboardAPI:
         """Render the calendar page with availability data."""
         try:
             # Default to current month if not specified
-            now = datetime.now()
-            year = year or now.year
-            month = month or now.month
+            today = self._today()
+            year = year or today.year
+            month = month or today.month
             
             # Get park list
             if park == "all":
-                park_list = get_all_parks()
+                park_list = _ALL_PARKS
             else:
                 try:
                     park_list = [ParkEnum(park)]
                 except ValueError:
-                    park_list = get_all_parks()
+                    park_list = _ALL_PARKS
             
-            # Generate calendar data
-            calendar_data = await self.generate_calendar_data(year, month, park_list)
+            # Generate calendar data; the page only shows per-day totals
+            calendar_data = await self.get_cached_calendar_data(
+                year, month, park_list, include_sites=False
+            )
             
             # Get park options for dropdown
-            park_options = []
-            for p in get_all_parks():
-                park_info = get_park_info(p)
-                park_options.append({
-                    'value': p.value,
-                    'name': park_info.display_name,
-                    'selected': p.value == park or (park == "all" and len(park_list) > 1)
-                })
+            select_all = park == "all" and len(park_list) > 1
+            park_options = [
+                {**option, 'selected': select_all or option['value'] == park}
+                for option in self._park_options
+            ]
+            
+            if self._calendar_template is None:
+                self._load_templates()
             
             context = {
                 'request': request,
@@ -322,98 +479,232 @@ class DashboardAPI:
                 'current_month': month,
                 'selected_park': park,
                 'park_options': park_options,
-                'month_names': [
-                    'January', 'February', 'March', 'April', 'May', 'June',
-                    'July', 'August', 'September', 'October', 'November', 'December'
-                ]
+                'month_names': self.MONTH_NAMES
             }
             
-            return self.templates.TemplateResponse("calendar.html", context)
+            return HTMLResponse(self._calendar_template.render(context))
             
         except Exception as e:
             logger.error(f"Error rendering calendar page: {e}")
             # Return a basic error page
+            if self._error_template is None:
+                self._load_templates()
+            
             context = {
                 'request': request,
                 'error': str(e)
             }
-            return self.templates.TemplateResponse("error.html", context)
+            return HTMLResponse(self._error_template.render(context))
+    
+    @asynccontextmanager
+    async def lifespan(self, app: FastAPI) -> AsyncIterator[None]:
+        """
+        Run dashboard startup and shutdown around the serving application.
+        
+        Starlette does not run lifespan handlers of mounted sub-applications,
+        so an application that mounts this dashboard must pass this as its
+        own lifespan.
+        
+        Args:
+            app: The application being served
+        """
+        # Compile page templates before the first request arrives
+        self._load_templates()
+        self._health_task = asyncio.create_task(self._health_loop())
+        try:
+            yield
+        finally:
+            self._health_task.cancel()
+            self._health_task = None
+            # Release pooled database connections
+            await self.db_client.close()
+    
+    async def _health_loop(self) -> None:
+        """Refresh the cached database health status periodically."""
+        while True:
+            try:
+                self._db_healthy = await self.db_client.health_check()
+            except Exception as e:
+                logger.error(f"Health probe failed: {e}")
+                self._db_healthy = False
+            
+            await asyncio.sleep(HEALTH_PROBE_INTERVAL)
+    
+    def _load_templates(self) -> None:
+        """Compile the calendar and error page templates."""
+        self._calendar_template = self.templates.get_template("calendar.html")
+        self._error_template = self.templates.get_template("error.html")
+    
+    def _today(self) -> date:
+        """Return today's local date, re-reading the clock at most once a minute."""
+        minute = int(time.time() // 60)
+        if minute != self._cached_today[0]:
+            self._cached_today = (minute, date.today())
+        return self._cached_today[1]
+    
+    def _utc_timestamp(self) -> str:
+        """Return the current UTC time in ISO format, refreshed once a second."""
+        second = int(time.time())
+        if second != self._cached_timestamp[0]:
+            self._cached_timestamp = (second, datetime.utcnow().isoformat())
+        return self._cached_timestamp[1]
+    
+    def _cache_get(self, key: Tuple) -> Any:
+        """Return a cached value, or None if it is missing or expired."""
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._response_cache[key]
+            return None
+        
+        self._response_cache.move_to_end(key)
+        return value
+    
+    def _cache_set(self, key: Tuple, value: Any, ttl: float) -> None:
+        """
+        Store a value in the response cache for ttl seconds.
+        
+        Expired entries are dropped first; if the cache is still full, the least
+        recently used entry is evicted.
+        """
+        now = time.monotonic()
+        expired = [k for k, (expires_at, _) in self._response_cache.items() if expires_at < now]
+        for k in expired:
+            del self._response_cache[k]
+        
+        self._response_cache[key] = (now + ttl, value)
+        self._response_cache.move_to_end(key)
+        if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+    
+    def invalidate_cache(self) -> None:
+        """Drop all cached responses."""
+        self._response_cache.clear()
+    
+    async def get_cached_calendar_data(
+        self,
+        year: int,
+        month: int,
+        parks: List[ParkEnum],
+        include_sites: bool = True
+    ) -> CalendarMonthData:
+        """
+        Get calendar data for a month, reusing a recent result when available.
+        
+        The cache key uses the sorted park values so that park lists given in
+        a different order share one entry. Months without any rows are not
+        cached, since a failed query looks the same.
+        """
+        cache_key = (
+            'calendar', year, month,
+            tuple(sorted(park.value for park in parks)),
+            include_sites
+        )
+        calendar_data = self._cache_get(cache_key)
+        
+        if calendar_data is None:
+            calendar_data = await self.generate_calendar_data(
+                year, month, parks, include_sites
+            )
+            if any(day.total_sites for day in calendar_data.days):
+                self._cache_set(cache_key, calendar_data, CALENDAR_CACHE_TTL)
+        
+        return calendar_data
     
     async def generate_calendar_data(
         self,
         year: int,
         month: int,
-        parks: List[ParkEnum]
+        parks: List[ParkEnum],
+        include_sites: bool = True
     ) -> CalendarMonthData:
-        """Generate calendar data for a specific month."""
+        """
+        Generate calendar data for a specific month.
+        
+        Args:
+            year: Calendar year
+            month: Calendar month (1-12)
+            parks: Parks to include
+            include_sites: Attach the available sites to each day. When False,
+                per-day counts and prices are aggregated by the database and
+                each day's sites list is left empty.
+            
+        Returns:
+            Calendar data for the month
+        """
         try:
             # Get the first and last day of the month
             first_day = date(year, month, 1)
             last_day_num = monthrange(year, month)[1]
             last_day = date(year, month, last_day_num)
             
-            # Get availability data for all parks in this month
-            all_availability = []
-            for park in parks:
-                park_availability = await self.get_availability_data(
-                    park, first_day, last_day
-                )
-                all_availability.extend(park_availability)
+            day_summaries = None
+            available_by_date: Dict[date, List[CampsiteAvailability]] = {}
+            
+            if not include_sites:
+                async with self._db_semaphore:
+                    summary_rows = await self.db_client.get_calendar_day_summary(
+                        parks, first_day, last_day
+                    )
+                if summary_rows is not None:
+                    day_summaries = {
+                        row['check_in_date']: (
+                            row['available_count'],
+                            row['total_sites'],
+                            row['avg_price'],
+                            row['min_price']
+                        )
+                        for row in summary_rows
+                    }
+            
+            if day_summaries is None:
+                # Get availability data for all parks in this month with one query
+                async with self._db_semaphore:
+                    all_availability = await self.db_client.get_availability_by_parks(
+                        parks, first_day, last_day
+                    )
+                day_summaries, available_by_date = self._summarize_days(all_availability)
             
             # Generate calendar days
             calendar_days = []
             total_available = 0
             weekend_available = 0
             
-            for day in range(1, last_day_num + 1):
-                current_date = date(year, month, day)
-                is_weekend = current_date.weekday() >= 5  # Saturday = 5, Sunday = 6
-                
-                # Get availability for this day
-                day_availability = [
-                    avail for avail in all_availability
-                    if avail.check_in_date == current_date
-                    and avail.status == AvailabilityStatus.AVAILABLE
-                ]
-                
-                # Calculate statistics
-                available_count = len(day_availability)
-                total_sites = len([
-                    avail for avail in all_availability
-                    if avail.check_in_date == current_date
-                ])
+            one_day = timedelta(days=1)
+            current_date = first_day - one_day
+            weekday = first_day.weekday() - 1
+            
+            for _ in range(last_day_num):
+                current_date += one_day
+                weekday = (weekday + 1) % 7
+                is_weekend = weekday >= 5  # Saturday = 5, Sunday = 6
                 
-                # Calculate price statistics
-                prices = [avail.price for avail in day_availability if avail.price]
-                avg_price = sum(prices) / len(prices) if prices else None
-                min_price = min(prices) if prices else None
+                available_count, total_sites, avg_price, min_price = day_summaries.get(
+                    current_date, (0, 0, None, None)
+                )
                 
-                day_data = CalendarDayData(
+                calendar_days.append(CalendarDayData(
                     date=current_date,
                     available_count=available_count,
                     total_sites=total_sites,
                     weekend=is_weekend,
-                    sites=day_availability,
+                    sites=available_by_date.get(current_date, []),
                     avg_price=avg_price,
                     min_price=min_price
-                )
-                
-                calendar_days.append(day_data)
+                ))
                 total_available += available_count
                 
                 if is_weekend:
                     weekend_available += available_count
             
             # Create month data
-            month_names = [
-                'January', 'February', 'March', 'April', 'May', 'June',
-                'July', 'August', 'September', 'October', 'November', 'December'
-            ]
-            
             return CalendarMonthData(
                 year=year,
                 month=month,
-                month_name=month_names[month - 1],
+                month_name=self.MONTH_NAMES[month - 1],
                 days=calendar_days,
                 parks=[park.value for park in parks],
                 total_available=total_available,
@@ -424,28 +715,114 @@ class DashboardAPI:
             logger.error(f"Error generating calendar data: {e}")
             raise
     
+    @staticmethod
+    def _summarize_days(
+        availability: List[CampsiteAvailability]
+    ) -> Tuple[Dict[date, Tuple[int, int, Optional[float], Optional[float]]], Dict[date, List[CampsiteAvailability]]]:
+        """
+        Aggregate availability rows into per-day statistics.
+        
+        Args:
+            availability: Availability rows to aggregate
+            
+        Returns:
+            Tuple of (date -> (available_count, total_sites, avg_price, min_price),
+            date -> available sites)
+        """
+        # Bucket rows by check-in date in a single pass
+        sites_by_date: Dict[date, int] = defaultdict(int)
+        available_by_date: Dict[date, List[CampsiteAvailability]] = defaultdict(list)
+        for avail in availability:
+            sites_by_date[avail.check_in_date] += 1
+            if avail.status == AvailabilityStatus.AVAILABLE:
+                available_by_date[avail.check_in_date].append(avail)
+        
+        day_summaries = {}
+        for day, total_sites in sites_by_date.items():
+            day_availability = available_by_date.get(day, [])
+            
+            # Calculate price statistics in a single pass
+            price_total = 0.0
+            price_count = 0
+            min_price = None
+            for avail in day_availability:
+                price = avail.price
+                if price:
+                    price_total += price
+                    price_count += 1
+                    if min_price is None or price < min_price:
+                        min_price = price
+            avg_price = price_total / price_count if price_count else None
+            
+            day_summaries[day] = (len(day_availability), total_sites, avg_price, min_price)
+        
+        return day_summaries, available_by_date
+    
+    @staticmethod
+    async def _stream_availability(
+        header: Dict[str, Any],
+        availability: List[CampsiteAvailability]
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream a JSON object of header fields plus an "availability" array.
+        
+        Rows are encoded in chunks so the full payload is never held in memory
+        as one document.
+        
+        Args:
+            header: Top-level fields to emit before the array
+            availability: Rows to emit in the array
+            
+        Yields:
+            Encoded JSON fragments
+        """
+        # Reopen the encoded header object to append the array
+        yield orjson.dumps(header)[:-1] + b',"availability":['
+        
+        for i in range(0, len(availability), STREAM_CHUNK_ROWS):
+            chunk = b','.join(
+                orjson.dumps(avail.dict())
+                for avail in availability[i:i + STREAM_CHUNK_ROWS]
+            )
+            yield b',' + chunk if i else chunk
+        
+        yield b']}'
+    
+    @staticmethod
+    def _parse_cursor(cursor: str) -> Tuple[date, str]:
+        """
+        Parse a pagination cursor of the form "<check_in_date>,<site_id>".
+        
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        check_in, _, site_id = cursor.partition(",")
+        if not site_id:
+            raise ValueError(f"Invalid cursor: {cursor}")
+        return date.fromisoformat(check_in), site_id
+    
     async def get_availability_data(
         self,
         park: ParkEnum,
         start_date: date,
         end_date: date,
-        site_types: Optional[List[SiteTypeEnum]] = None
+        site_types: Optional[List[SiteTypeEnum]] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[date, str]] = None
     ) -> List[CampsiteAvailability]:
         """Get availability data for a park and date range."""
         try:
-            # Get availability from database
-            availability = await self.db_client.get_availability_by_park(
-                park, start_date, end_date
-            )
-            
-            # Filter by site types if specified
-            if site_types:
-                availability = [
-                    avail for avail in availability
-                    if avail.site_type in site_types
-                ]
-            
-            return availability
+            # Get availability from database, filtered by site type in the query
+            # so that pages stay full
+            async with self._db_semaphore:
+                return await self.db_client.get_availability_by_park(
+                    park,
+                    start_date,
+                    end_date,
+                    site_types=site_types,
+                    limit=limit,
+                    after=after
+                )
             
         except Exception as e:
             logger.error(f"Error getting availability data for {park}: {e}")
@@ -460,31 +837,7 @@ CALENDAR_TEMPLATE = """
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Southern California Campsite Tracker</title>
-    <style>
-        body { font-family: Arial, sans-serif; margin: 0; padding: 20px; background: #f5f5f5; }
-        .container { max-width: 1200px; margin: 0 auto; background: white; border-radius: 8px; padding: 20px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
-        .header { text-align: center; margin-bottom: 30px; }
-        .controls { display: flex; justify-content: space-between; align-items: center; margin-bottom: 20px; flex-wrap: wrap; gap: 10px; }
-        .calendar { display: grid; grid-template-columns: repeat(7, 1fr); gap: 2px; margin-bottom: 20px; }
-        .calendar-header { background: #2c3e50; color: white; padding: 10px; text-align: center; font-weight: bold; }
-        .calendar-day { background: white; border: 1px solid #ddd; min-height: 100px; padding: 5px; position: relative; }
-        .calendar-day.weekend { background: #f8f9fa; }
-        .calendar-day.has-availability { background: #d4edda; border-color: #c3e6cb; }
-        .calendar-day.weekend.has-availability { background: #d1ecf1; border-color: #bee5eb; }
-        .day-number { font-weight: bold; margin-bottom: 5px; }
-        .availability-count { font-size: 12px; color: #28a745; }
-        .weekend-indicator { font-size: 10px; color: #6c757d; }
-        .stats { display: flex; justify-content: space-around; text-align: center; background: #f8f9fa; padding: 15px; border-radius: 5px; }
-        .stat { flex: 1; }
-        .stat-number { font-size: 24px; font-weight: bold; color: #2c3e50; }
-        .stat-label { font-size: 12px; color: #6c757d; }
-        select, button { padding: 8px 12px; border: 1px solid #ddd; border-radius: 4px; }
-        button { background: #007bff; color: white; border-color: #007bff; cursor: pointer; }
-        button:hover { background: #0056b3; }
-        .legend { display: flex; gap: 20px; justify-content: center; margin-top: 15px; font-size: 12px; }
-        .legend-item { display: flex; align-items: center; gap: 5px; }
-        .legend-color { width: 15px; height: 15px; border: 1px solid #ddd; }
-    </style>
+    <link rel="stylesheet" href="/static/calendar.css?v=1">
 </head>
 <body>
     <div class="container">
@@ -580,33 +933,13 @@ CALENDAR_TEMPLATE = """
         </div>
     </div>
     
-    <script>
-        function updateCalendar() {
-            const park = document.getElementById('parkSelect').value;
-            const month = document.getElementById('monthSelect').value;
-            const year = document.getElementById('yearSelect').value;
-            
-            window.location.href = `/calendar?year=${year}&month=${month}&park=${park}`;
-        }
-    </script>
+    <script src="/static/calendar.js?v=1"></script>
 </body>
 </html>
 """
 
 
-async def create_templates_directory():
-    """Create templates directory and files if they don't exist."""
-    import os
-    
-    templates_dir = "src/dashboard/templates"
-    os.makedirs(templates_dir, exist_ok=True)
-    
-    # Write calendar template
-    with open(f"{templates_dir}/calendar.html", "w") as f:
-        f.write(CALENDAR_TEMPLATE)
-    
-    # Create error template
-    error_template = """
+ERROR_TEMPLATE = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -623,9 +956,30 @@ async def create_templates_directory():
 </body>
 </html>
     """
+
+
+def _write_template_files(templates_dir: str = "src/dashboard/templates") -> None:
+    """Write the dashboard templates, skipping files that are already current."""
+    os.makedirs(templates_dir, exist_ok=True)
     
-    with open(f"{templates_dir}/error.html", "w") as f:
-        f.write(error_template)
+    for name, content in (("calendar.html", CALENDAR_TEMPLATE), ("error.html", ERROR_TEMPLATE)):
+        path = os.path.join(templates_dir, name)
+        
+        try:
+            with open(path) as f:
+                if f.read() == content:
+                    continue
+        except FileNotFoundError:
+            pass
+        
+        with open(path, "w") as f:
+            f.write(content)
+
+
+async def create_templates_directory():
+    """Create templates directory and files if they don't exist."""
+    # Blocking file I/O runs in a worker thread to keep the event loop free
+    await asyncio.to_thread(_write_template_files)
 
 
 # Initialize dashboard
@@ -634,7 +988,7 @@ app = dashboard.app
 
 
 async def run_dashboard(host: str = "127.0.0.1", port: int = 8000):
-    """Run the dashboard server."""
+    """Run the dashboard server in-process on the current event loop."""
     import uvicorn
     
     # Create templates
@@ -653,5 +1007,39 @@ async def run_dashboard(host: str = "127.0.0.1", port: int = 8000):
     await server.serve()
 
 
+def serve_dashboard(
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: Optional[int] = None
+):
+    """
+    Run the dashboard server with multiple worker processes.
+    
+    Each worker imports this module and builds its own DashboardAPI, so every
+    process owns its own database connection pool. uvicorn picks uvloop and
+    httptools automatically when installed (uvicorn[standard]).
+    
+    Args:
+        host: Host to bind to
+        port: Port to bind to
+        workers: Number of worker processes (defaults to the CPU count)
+    """
+    import uvicorn
+    
+    # Create templates before workers start rendering them
+    _write_template_files()
+    
+    workers = workers or os.cpu_count() or 1
+    logger.info(f"Starting dashboard server on {host}:{port} with {workers} workers")
+    
+    uvicorn.run(
+        "src.dashboard.calendar_view:app",
+        host=host,
+        port=port,
+        workers=workers,
+        log_level="info"
+    )
+
+
 if __name__ == "__main__":
-    asyncio.run(run_dashboard())
\ No newline at end of file
+    serve_dashboard()
\ No newline at end of file
@@ -0,0 +1,7 @@
+function updateCalendar() {
+    const park = document.getElementById('parkSelect').value;
+    const month = document.getElementById('monthSelect').value;
+    const year = document.getElementById('yearSelect').value;
+    
+    window.location.href = `/calendar?year=${year}&month=${month}&park=${park}`;
+}
\ No newline at end of file
@@ -0,0 +1,35 @@
+-- Calendar day summaries for the dashboard
+-- Migration 002: Aggregate per-day availability in the database
+
+-- Covers the park/date range filter and the per-status counts
+CREATE INDEX idx_availability_park_date_status ON campsite_availability(park, check_in_date, status);
+
+-- Per-day counts and prices for a set of parks over a date range.
+-- Prices follow the dashboard's rules: only available sites with a non-zero price count.
+CREATE OR REPLACE FUNCTION calendar_day_summary(
+    p_parks park_enum[],
+    p_start_date DATE,
+    p_end_date DATE
+)
+RETURNS TABLE (
+    check_in_date DATE,
+    available_count BIGINT,
+    total_sites BIGINT,
+    avg_price NUMERIC,
+    min_price NUMERIC
+) AS $$
+    SELECT 
+        ca.check_in_date,
+        COUNT(*) FILTER (WHERE ca.status = 'available') AS available_count,
+        COUNT(*) AS total_sites,
+        AVG(ca.price) FILTER (WHERE ca.status = 'available' AND ca.price > 0) AS avg_price,
+        MIN(ca.price) FILTER (WHERE ca.status = 'available' AND ca.price > 0) AS min_price
+    FROM campsite_availability ca
+    WHERE 
+        ca.park = ANY(p_parks)
+        AND ca.check_in_date BETWEEN p_start_date AND p_end_date
+    GROUP BY ca.check_in_date
+    ORDER BY ca.check_in_date;
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION calendar_day_summary(park_enum[], DATE, DATE) IS 'Per-day availability counts and prices used by the calendar dashboard';
\ No newline at end of file
@@ -0,0 +1,6 @@
+-- Notification history lookups
+-- Migration 003: Cover the duplicate-notification check with one index
+
+-- Matches check_notification_sent: equality on park/site/date/status, range on created_at
+CREATE INDEX idx_notifications_sent_lookup
+    ON notification_records(park, site_id, check_in_date, status, created_at);
\ No newline at end of file
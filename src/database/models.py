@@ -4,13 +4,20 @@ Pydantic models for campsite availability tracking.
 Data models for validation, serialization, and database operations.
 """
 
-from typing import List, Optional, Dict, Any
+import re
+from typing import Iterator, List, Optional, Dict, Any
 from datetime import datetime, date
 from enum import Enum
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 from ..config.parks import ParkEnum
 
 
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Bit i is set when weekday i (0=Monday) is a weekend day: Saturday and Sunday
+_WEEKEND_BITS = 0b1100000
+
+
 class SiteTypeEnum(str, Enum):
     """Types of camping sites available."""
     TENT = "tent"
@@ -56,20 +63,44 @@ class CampsiteAvailability(BaseModel):
     scraped_at: datetime = Field(default_factory=datetime.utcnow, description="When data was collected")
     url: Optional[str] = Field(None, description="Direct booking URL if available")
     
-    @validator('check_in_date')
+    @field_validator('check_in_date')
+    @classmethod
     def validate_future_date(cls, v: date) -> date:
         """Validate that check-in date is not in the past."""
         if v < date.today():
             raise ValueError('Check-in date must be today or in the future')
         return v
     
-    @validator('site_id', 'site_name')
+    @field_validator('site_id', 'site_name')
+    @classmethod
     def validate_not_empty(cls, v: str) -> str:
         """Validate that string fields are not empty."""
         if not v or not v.strip():
             raise ValueError('Field cannot be empty')
         return v.strip()
     
+    @property
+    def db_row(self) -> Dict[str, Any]:
+        """
+        Database row for this record's current field values.
+        
+        Enum fields already hold their values (use_enum_values), so only the
+        date and timestamp need converting.
+        """
+        return {
+            'park': self.park,
+            'site_id': self.site_id,
+            'site_name': self.site_name,
+            'site_type': self.site_type,
+            'check_in_date': self.check_in_date.isoformat(),
+            'status': self.status,
+            'price': self.price,
+            'max_occupancy': self.max_occupancy,
+            'amenities': self.amenities,
+            'scraped_at': self.scraped_at.isoformat(),
+            'url': self.url
+        }
+    
     class Config:
         """Pydantic configuration."""
         use_enum_values = True
@@ -98,21 +129,25 @@ class AlertRule(BaseModel):
     updated_at: datetime = Field(default_factory=datetime.utcnow, description="When rule was last updated")
     is_active: bool = Field(True, description="Whether rule is active")
     
-    @validator('user_email')
+    @field_validator('user_email')
+    @classmethod
     def validate_email(cls, v: str) -> str:
         """Validate email format."""
-        if '@' not in v or '.' not in v.split('@')[1]:
+        v = v.strip()
+        if not _EMAIL_RE.match(v):
             raise ValueError('Invalid email format')
-        return v.lower().strip()
+        return v.lower()
     
-    @validator('parks')
+    @field_validator('parks')
+    @classmethod
     def validate_parks_not_empty(cls, v: List[ParkEnum]) -> List[ParkEnum]:
         """Validate that parks list is not empty."""
         if not v:
             raise ValueError('At least one park must be specified')
         return v
     
-    @validator('site_types')
+    @field_validator('site_types')
+    @classmethod
     def validate_site_types_not_empty(cls, v: List[SiteTypeEnum]) -> List[SiteTypeEnum]:
         """Validate that site types list is not empty."""
         if not v:
@@ -143,10 +178,11 @@ class ScrapeResult(BaseModel):
     success: bool = Field(False, description="Whether scraping was successful")
     raw_data: Optional[Dict[str, Any]] = Field(None, description="Raw scraped data for debugging")
     
-    @validator('available_sites')
-    def validate_available_sites(cls, v: int, values: Dict[str, Any]) -> int:
+    @field_validator('available_sites')
+    @classmethod
+    def validate_available_sites(cls, v: int, info: ValidationInfo) -> int:
         """Validate that available sites doesn't exceed total sites found."""
-        if 'sites_found' in values and v > values['sites_found']:
+        if 'sites_found' in info.data and v > info.data['sites_found']:
             raise ValueError('Available sites cannot exceed total sites found')
         return v
     
@@ -189,12 +225,14 @@ class NotificationRecord(BaseModel):
         """Generate unique key for preventing duplicate notifications."""
         return f"{self.park}_{self.site_id}_{self.check_in_date.isoformat()}"
     
-    @validator('recipient_email')
+    @field_validator('recipient_email')
+    @classmethod
     def validate_email(cls, v: str) -> str:
         """Validate email format."""
-        if '@' not in v or '.' not in v.split('@')[1]:
+        v = v.strip()
+        if not _EMAIL_RE.match(v):
             raise ValueError('Invalid email format')
-        return v.lower().strip()
+        return v.lower()
     
     class Config:
         """Pydantic configuration."""
@@ -216,29 +254,32 @@ class CampsiteSearchQuery(BaseModel):
     min_occupancy: Optional[int] = Field(None, ge=1, description="Minimum occupancy requirement")
     weekend_only: bool = Field(False, description="Only search weekend dates")
     
-    @validator('end_date')
-    def validate_date_range(cls, v: date, values: Dict[str, Any]) -> date:
+    @field_validator('end_date')
+    @classmethod
+    def validate_date_range(cls, v: date, info: ValidationInfo) -> date:
         """Validate that end date is after start date."""
-        if 'start_date' in values and v <= values['start_date']:
+        if 'start_date' in info.data and v <= info.data['start_date']:
             raise ValueError('End date must be after start date')
         return v
     
-    @validator('start_date')
+    @field_validator('start_date')
+    @classmethod
     def validate_start_date(cls, v: date) -> date:
         """Validate that start date is not in the past."""
         if v < date.today():
             raise ValueError('Start date cannot be in the past')
         return v
     
+    def iter_date_range(self) -> Iterator[date]:
+        """Yield the dates in the search range, one at a time."""
+        for o in range(self.start_date.toordinal(), self.end_date.toordinal() + 1):
+            # Ordinal 1 (0001-01-01) was a Monday, so (ordinal - 1) % 7 is the weekday
+            if not self.weekend_only or (_WEEKEND_BITS >> ((o - 1) % 7)) & 1:
+                yield date.fromordinal(o)
+    
     def get_date_range(self) -> List[date]:
         """Get list of dates in the search range."""
-        dates = []
-        current = self.start_date
-        while current <= self.end_date:
-            if not self.weekend_only or current.weekday() >= 5:  # 5=Saturday, 6=Sunday
-                dates.append(current)
-            current = date.fromordinal(current.toordinal() + 1)
-        return dates
+        return list(self.iter_date_range())
     
     class Config:
         """Pydantic configuration."""
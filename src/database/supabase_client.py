@@ -8,26 +8,93 @@ campsite availability data, alert rules, and notification records.
 import asyncio
 import json
 import logging
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime, date, timedelta
-from uuid import uuid4
+import os
+from typing import List, Dict, Any, Optional, Set, Tuple
+from datetime import datetime, date, timedelta, timezone
+from uuid import UUID, uuid4
 
-import httpx
-from pydantic import ValidationError
+import orjson
+from pydantic import TypeAdapter, ValidationError
+
+try:
+    import asyncpg
+except ImportError:  # Only needed for the direct connection when DATABASE_URL is set
+    asyncpg = None
 
 from ..config.settings import settings
 from ..config.parks import ParkEnum
+from ..scraper.rate_limiter import RateLimiter
 from ..database.models import (
     CampsiteAvailability,
     AlertRule, 
     ScrapeResult,
     NotificationRecord,
     CampsiteSearchQuery,
-    AvailabilityStatus
+    AvailabilityStatus,
+    SiteTypeEnum
 )
 
 logger = logging.getLogger(__name__)
 
+# Columns read back into CampsiteAvailability; id and audit timestamps are never used
+_AVAILABILITY_COLUMNS = (
+    "park, site_id, site_name, site_type, check_in_date, status, "
+    "price, max_occupancy, amenities, scraped_at, url"
+)
+
+# Validates a whole list of alert rules in one pydantic-core call
+_ALERT_RULE_LIST_ADAPTER = TypeAdapter(List[AlertRule])
+
+# Row sets at least this large are converted in a worker thread, off the event loop
+ROW_CONVERSION_THREAD_THRESHOLD = 500
+
+# Direct value -> member maps, skipping Enum.__call__ for per-row conversions
+_PARK_BY_VALUE = ParkEnum._value2member_map_
+_SITE_TYPE_BY_VALUE = SiteTypeEnum._value2member_map_
+
+# Largest single insert used by record_notifications_bulk
+NOTIFICATION_INSERT_CHUNK_SIZE = 500
+
+
+def _parse_date(value: Any) -> date:
+    """Parse a date column that may arrive as a date or an ISO string."""
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value[:10])
+
+
+def _parse_datetime(value: Any) -> datetime:
+    """
+    Parse a timestamp column that may arrive as a datetime or an ISO string.
+    
+    asyncpg returns timestamptz columns as aware datetimes and the REST path
+    may return offsets like +00:00, while the rest of the app compares against
+    datetime.utcnow(), so everything is normalized to naive UTC.
+    """
+    if not isinstance(value, datetime):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+# Failures of the underlying transports that are worth retrying: connection
+# resets and timeouts, plus PostgreSQL refusing or dropping connections
+_TRANSIENT_ERRORS: Tuple[type, ...] = (OSError, asyncio.TimeoutError)
+if asyncpg is not None:
+    _TRANSIENT_ERRORS += (
+        asyncpg.exceptions.TooManyConnectionsError,
+        asyncpg.exceptions.CannotConnectNowError,
+        # Includes ConnectionDoesNotExistError for connections dropped mid-query
+        asyncpg.exceptions.PostgresConnectionError,
+    )
+
+
+def _uuid4_batch(count: int) -> List[str]:
+    """Generate count random UUID strings from a single os.urandom call."""
+    raw = os.urandom(16 * count)
+    return [str(UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, 16 * count, 16)]
+
 
 class SupabaseError(Exception):
     """Exception raised for Supabase operations."""
@@ -56,11 +123,18 @@ class SupabaseClient:
         """
         self.project_ref = project_ref or settings.supabase_project_ref
         self.access_token = access_token or settings.supabase_access_token
-        self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(30.0),
-            limits=httpx.Limits(max_connections=settings.db_pool_size)
+        # Throttle requests to the project's quota and back off on transient errors
+        self.rate_limiter = RateLimiter(
+            requests_per_minute=settings.db_requests_per_minute,
+            backoff_multiplier=settings.backoff_multiplier,
+            max_backoff_seconds=5.0
         )
         
+        # Direct PostgreSQL pool, created on first use when a database URL is configured
+        self.database_url = settings.database_url
+        self._pool = None
+        self._pool_lock = asyncio.Lock()
+        
         # Table names
         self.tables = {
             'availability': 'campsite_availability',
@@ -78,9 +152,35 @@ class SupabaseClient:
         await self.close()
     
     async def close(self):
-        """Close the HTTP client."""
-        if self.client:
-            await self.client.aclose()
+        """Close the database pool."""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+    
+    async def _get_pool(self):
+        """
+        Get the asyncpg connection pool, creating it on first use.
+        
+        Returns:
+            asyncpg.Pool, or None when no database URL is configured
+        """
+        if not self.database_url:
+            return None
+        
+        if self._pool is None:
+            async with self._pool_lock:
+                if self._pool is None:
+                    if asyncpg is None:
+                        raise SupabaseError("DATABASE_URL is set but asyncpg is not installed")
+                    
+                    self._pool = await asyncpg.create_pool(
+                        self.database_url,
+                        min_size=min(2, settings.db_pool_size),
+                        max_size=settings.db_pool_size
+                    )
+                    logger.info(f"Opened PostgreSQL pool (max {settings.db_pool_size} connections)")
+        
+        return self._pool
     
     async def health_check(self) -> bool:
         """
@@ -116,26 +216,23 @@ class SupabaseClient:
             return True
         
         try:
-            # Convert to dict format for storage
-            records = []
+            # Keep the last row per conflict key; a batch may not upsert the same key twice
+            latest_rows = {}
             for avail in availability:
-                record = {
-                    'id': str(uuid4()),
-                    'park': avail.park.value,
-                    'site_id': avail.site_id,
-                    'site_name': avail.site_name,
-                    'site_type': avail.site_type.value,
-                    'check_in_date': avail.check_in_date.isoformat(),
-                    'status': avail.status.value,
-                    'price': avail.price,
-                    'max_occupancy': avail.max_occupancy,
-                    'amenities': avail.amenities,
-                    'scraped_at': avail.scraped_at.isoformat(),
-                    'url': avail.url,
-                    'created_at': datetime.utcnow().isoformat(),
-                    'updated_at': datetime.utcnow().isoformat()
+                row = avail.db_row
+                latest_rows[(row['park'], row['site_id'], row['check_in_date'])] = row
+            
+            # Convert to dict format for storage
+            now_iso = datetime.utcnow().isoformat()
+            records = [
+                {
+                    'id': record_id,
+                    **row,
+                    'created_at': now_iso,
+                    'updated_at': now_iso
                 }
-                records.append(record)
+                for record_id, row in zip(_uuid4_batch(len(latest_rows)), latest_rows.values())
+            ]
             
             # Batch insert with upsert (on conflict update)
             chunk_size = 1000
@@ -152,7 +249,10 @@ class SupabaseClient:
                 if not result.get('success'):
                     raise SupabaseError(f"Failed to insert availability batch: {result.get('error')}")
             
-            logger.info(f"Successfully stored {len(availability)} availability records")
+            logger.info(
+                f"Successfully stored {len(records)} availability records "
+                f"({len(availability) - len(records)} duplicates skipped)"
+            )
             return True
             
         except Exception as e:
@@ -164,7 +264,10 @@ class SupabaseClient:
         park: ParkEnum,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
-        status_filter: Optional[List[AvailabilityStatus]] = None
+        status_filter: Optional[List[AvailabilityStatus]] = None,
+        site_types: Optional[List[SiteTypeEnum]] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[date, str]] = None
     ) -> List[CampsiteAvailability]:
         """
         Retrieve availability data for a specific park.
@@ -174,66 +277,229 @@ class SupabaseClient:
             start_date: Optional start date filter
             end_date: Optional end date filter
             status_filter: Optional status filter
+            site_types: Optional site type filter
+            limit: Optional maximum number of rows to return
+            after: Optional (check_in_date, site_id) keyset cursor; only rows
+                ordered after it are returned
             
         Returns:
-            List of availability records
+            List of availability records ordered by check_in_date, site_id
         """
         try:
-            # Build query conditions
-            conditions = [f"park = '{park.value}'"]
+            # Build query conditions; values are bound as $n parameters
+            params: List[Any] = [park.value]
+            conditions = ["park = $1::park_enum"]
             
             if start_date:
-                conditions.append(f"check_in_date >= '{start_date.isoformat()}'")
+                params.append(start_date)
+                conditions.append(f"check_in_date >= ${len(params)}::date")
             
             if end_date:
-                conditions.append(f"check_in_date <= '{end_date.isoformat()}'")
+                params.append(end_date)
+                conditions.append(f"check_in_date <= ${len(params)}::date")
             
             if status_filter:
-                status_values = [f"'{status.value}'" for status in status_filter]
-                conditions.append(f"status IN ({','.join(status_values)})")
+                params.append([status.value for status in status_filter])
+                conditions.append(f"status = ANY(${len(params)}::availability_status_enum[])")
+            
+            if site_types:
+                params.append([site_type.value for site_type in site_types])
+                conditions.append(f"site_type = ANY(${len(params)}::site_type_enum[])")
+            
+            if after:
+                after_date, after_site_id = after
+                params.extend([after_date, after_site_id])
+                conditions.append(
+                    f"(check_in_date, site_id) > (${len(params) - 1}::date, ${len(params)})"
+                )
             
             where_clause = " AND ".join(conditions)
+            limit_clause = ""
+            if limit:
+                params.append(int(limit))
+                limit_clause = f"LIMIT ${len(params)}"
             
             query = f"""
-            SELECT * FROM {self.tables['availability']}
+            SELECT {_AVAILABILITY_COLUMNS} FROM {self.tables['availability']}
             WHERE {where_clause}
             ORDER BY check_in_date, site_id
+            {limit_clause}
             """
             
-            result = await self._execute_query(query)
+            result = await self._execute_query(query, tuple(params))
             
             if not result.get('success'):
                 raise SupabaseError(f"Query failed: {result.get('error')}")
             
-            # Convert results to CampsiteAvailability objects
-            availability_list = []
-            for row in result.get('data', []):
-                try:
-                    availability = CampsiteAvailability(
-                        park=ParkEnum(row['park']),
-                        site_id=row['site_id'],
-                        site_name=row['site_name'],
-                        site_type=row['site_type'],
-                        check_in_date=datetime.fromisoformat(row['check_in_date']).date(),
-                        status=AvailabilityStatus(row['status']),
-                        price=row.get('price'),
-                        max_occupancy=row.get('max_occupancy'),
-                        amenities=row.get('amenities', []),
-                        scraped_at=datetime.fromisoformat(row['scraped_at']),
-                        url=row.get('url')
-                    )
-                    availability_list.append(availability)
-                    
-                except (ValidationError, ValueError) as e:
-                    logger.warning(f"Skipping invalid availability record: {e}")
-                    continue
-            
-            return availability_list
+            return await self._convert_availability_rows(result.get('data', []))
             
         except Exception as e:
             logger.error(f"Failed to retrieve availability for {park}: {e}")
             return []
     
+    async def get_availability_by_parks(
+        self,
+        parks: List[ParkEnum],
+        start_date: date,
+        end_date: date
+    ) -> List[CampsiteAvailability]:
+        """
+        Retrieve availability data for several parks in a single query.
+        
+        Args:
+            parks: Parks to query
+            start_date: Start date filter (inclusive)
+            end_date: End date filter (inclusive)
+            
+        Returns:
+            List of availability records
+        """
+        if not parks:
+            return []
+        
+        try:
+            query = f"""
+            SELECT {_AVAILABILITY_COLUMNS} FROM {self.tables['availability']}
+            WHERE park = ANY($1::park_enum[])
+            AND check_in_date BETWEEN $2::date AND $3::date
+            ORDER BY check_in_date, park, site_id
+            """
+            params = ([park.value for park in parks], start_date, end_date)
+            
+            result = await self._execute_query(query, params)
+            
+            if not result.get('success'):
+                raise SupabaseError(f"Query failed: {result.get('error')}")
+            
+            return await self._convert_availability_rows(result.get('data', []))
+            
+        except Exception as e:
+            logger.error(f"Failed to retrieve availability for {len(parks)} parks: {e}")
+            return []
+    
+    async def get_calendar_day_summary(
+        self,
+        parks: List[ParkEnum],
+        start_date: date,
+        end_date: date
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get per-day availability counts and prices aggregated in the database.
+        
+        Uses the calendar_day_summary function from migration 002.
+        
+        Args:
+            parks: Parks to include
+            start_date: Start date (inclusive)
+            end_date: End date (inclusive)
+            
+        Returns:
+            One dict per date that has data, with check_in_date, available_count,
+            total_sites, avg_price and min_price; None if the query failed
+        """
+        if not parks:
+            return []
+        
+        try:
+            query = "SELECT * FROM calendar_day_summary($1::park_enum[], $2::date, $3::date)"
+            params = ([park.value for park in parks], start_date, end_date)
+            
+            result = await self._execute_query(query, params)
+            
+            if not result.get('success'):
+                raise SupabaseError(f"Query failed: {result.get('error')}")
+            
+            return [
+                {
+                    'check_in_date': _parse_date(row['check_in_date']),
+                    'available_count': int(row['available_count']),
+                    'total_sites': int(row['total_sites']),
+                    'avg_price': float(row['avg_price']) if row.get('avg_price') is not None else None,
+                    'min_price': float(row['min_price']) if row.get('min_price') is not None else None
+                }
+                for row in result.get('data', [])
+            ]
+            
+        except Exception as e:
+            logger.error(f"Failed to retrieve calendar day summary: {e}")
+            return None
+    
+    async def _convert_availability_rows(self, rows: List[Dict[str, Any]]) -> List[CampsiteAvailability]:
+        """
+        Convert availability rows, in a worker thread when the result set is large.
+        
+        Args:
+            rows: Raw rows returned by a query
+            
+        Returns:
+            List of availability records
+        """
+        if len(rows) >= ROW_CONVERSION_THREAD_THRESHOLD:
+            return await asyncio.to_thread(self._rows_to_availability, rows)
+        return self._rows_to_availability(rows)
+    
+    def _rows_to_availability(self, rows: List[Dict[str, Any]]) -> List[CampsiteAvailability]:
+        """
+        Convert availability table rows to CampsiteAvailability objects.
+        
+        Rows come from our own table, which only holds data that passed model
+        validation on the way in and is constrained by column types, so they
+        are built with model_construct instead of being re-validated.
+        
+        Args:
+            rows: Raw rows returned by a query
+            
+        Returns:
+            List of availability records, skipping malformed rows
+        """
+        # Convert the whole batch in one pass; only when a row is malformed
+        # go back over it row by row to find and skip the bad ones
+        try:
+            return [self._row_to_availability(row) for row in rows]
+        except (KeyError, TypeError, ValueError):
+            pass
+        
+        availability_list = []
+        for row in rows:
+            try:
+                availability_list.append(self._row_to_availability(row))
+                
+            except (KeyError, TypeError, ValueError) as e:
+                logger.warning(f"Skipping invalid availability record: {e}")
+                continue
+        
+        return availability_list
+    
+    @staticmethod
+    def _row_to_availability(row: Dict[str, Any]) -> CampsiteAvailability:
+        """
+        Build one CampsiteAvailability from an availability table row.
+        
+        Args:
+            row: Raw row returned by a query
+            
+        Returns:
+            Availability record
+            
+        Raises:
+            KeyError: If a required column is missing
+            TypeError, ValueError: If a date or price column is malformed
+        """
+        price = row.get('price')
+        return CampsiteAvailability.model_construct(
+            park=row['park'],
+            site_id=row['site_id'],
+            site_name=row['site_name'],
+            site_type=row['site_type'],
+            check_in_date=_parse_date(row['check_in_date']),
+            status=row['status'],
+            price=float(price) if price is not None else None,
+            max_occupancy=row.get('max_occupancy'),
+            amenities=row.get('amenities') or [],
+            scraped_at=_parse_datetime(row['scraped_at']),
+            url=row.get('url')
+        )
+    
     async def create_alert_rule(self, alert_rule: AlertRule) -> str:
         """
         Create a new alert rule.
@@ -249,19 +515,21 @@ class SupabaseClient:
         """
         try:
             rule_id = str(uuid4())
+            now_iso = datetime.utcnow().isoformat()
             
             record = {
                 'id': rule_id,
                 'user_email': alert_rule.user_email,
-                'parks': [park.value for park in alert_rule.parks],
-                'site_types': [st.value for st in alert_rule.site_types],
+                # use_enum_values means these lists already hold plain values
+                'parks': list(alert_rule.parks),
+                'site_types': list(alert_rule.site_types),
                 'weekend_only': alert_rule.weekend_only,
                 'min_nights': alert_rule.min_nights,
                 'max_price': alert_rule.max_price,
                 'advance_notice_days': alert_rule.advance_notice_days,
                 'is_active': alert_rule.is_active,
-                'created_at': datetime.utcnow().isoformat(),
-                'updated_at': datetime.utcnow().isoformat()
+                'created_at': now_iso,
+                'updated_at': now_iso
             }
             
             result = await self._call_mcp_tool("insert_rows", {
@@ -298,25 +566,23 @@ class SupabaseClient:
             if not result.get('success'):
                 raise SupabaseError(f"Query failed: {result.get('error')}")
             
+            rows = result.get('data', [])
+            
+            # Validate all rules in one pass; only when one is invalid go back
+            # over them row by row to find and skip the bad ones
+            try:
+                return _ALERT_RULE_LIST_ADAPTER.validate_python(
+                    [self._alert_rule_fields(row) for row in rows]
+                )
+            except (ValidationError, ValueError, KeyError):
+                pass
+            
             alert_rules = []
-            for row in result.get('data', []):
+            for row in rows:
                 try:
-                    alert_rule = AlertRule(
-                        id=row['id'],
-                        user_email=row['user_email'],
-                        parks=[ParkEnum(park) for park in row['parks']],
-                        site_types=[st for st in row['site_types']],
-                        weekend_only=row['weekend_only'],
-                        min_nights=row['min_nights'],
-                        max_price=row.get('max_price'),
-                        advance_notice_days=row['advance_notice_days'],
-                        created_at=datetime.fromisoformat(row['created_at']),
-                        updated_at=datetime.fromisoformat(row['updated_at']),
-                        is_active=row['is_active']
-                    )
-                    alert_rules.append(alert_rule)
+                    alert_rules.append(AlertRule(**self._alert_rule_fields(row)))
                     
-                except (ValidationError, ValueError) as e:
+                except (ValidationError, ValueError, KeyError) as e:
                     logger.warning(f"Skipping invalid alert rule: {e}")
                     continue
             
@@ -326,6 +592,34 @@ class SupabaseClient:
             logger.error(f"Failed to retrieve alert rules: {e}")
             return []
     
+    @staticmethod
+    def _alert_rule_fields(row: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Map an alert_rules table row to AlertRule field values.
+        
+        Args:
+            row: Raw row returned by a query
+            
+        Returns:
+            Keyword arguments for AlertRule
+            
+        Raises:
+            KeyError: If a required column or an enum value is unknown
+        """
+        return {
+            'id': str(row['id']),
+            'user_email': row['user_email'],
+            'parks': [_PARK_BY_VALUE[park] for park in row['parks']],
+            'site_types': [_SITE_TYPE_BY_VALUE[st] for st in row['site_types']],
+            'weekend_only': row['weekend_only'],
+            'min_nights': row['min_nights'],
+            'max_price': row.get('max_price'),
+            'advance_notice_days': row['advance_notice_days'],
+            'created_at': _parse_datetime(row['created_at']),
+            'updated_at': _parse_datetime(row['updated_at']),
+            'is_active': row['is_active']
+        }
+    
     async def record_notification(self, notification: NotificationRecord) -> bool:
         """
         Record a sent notification.
@@ -337,20 +631,7 @@ class SupabaseClient:
             bool: True if successful
         """
         try:
-            record = {
-                'id': str(uuid4()),
-                'alert_rule_id': notification.alert_rule_id,
-                'campsite_availability_key': notification.campsite_availability_key,
-                'recipient_email': notification.recipient_email,
-                'park': notification.park.value,
-                'site_id': notification.site_id,
-                'check_in_date': notification.check_in_date.isoformat(),
-                'status': notification.status.value,
-                'sent_at': notification.sent_at.isoformat() if notification.sent_at else None,
-                'error_message': notification.error_message,
-                'retry_count': notification.retry_count,
-                'created_at': datetime.utcnow().isoformat()
-            }
+            record = self._notification_row(notification, datetime.utcnow().isoformat())
             
             result = await self._call_mcp_tool("insert_rows", {
                 "table": self.tables['notifications'],
@@ -363,6 +644,59 @@ class SupabaseClient:
             logger.error(f"Failed to record notification: {e}")
             return False
     
+    async def record_notifications_bulk(self, notifications: List[NotificationRecord]) -> bool:
+        """
+        Store several notification records in as few inserts as possible.
+        
+        Batches larger than NOTIFICATION_INSERT_CHUNK_SIZE are split into
+        chunks that are inserted concurrently.
+        
+        Args:
+            notifications: Notification records to store
+            
+        Returns:
+            bool: True if every chunk was stored
+        """
+        if not notifications:
+            return True
+        
+        try:
+            now_iso = datetime.utcnow().isoformat()
+            records = [self._notification_row(notification, now_iso) for notification in notifications]
+            
+            chunk_size = NOTIFICATION_INSERT_CHUNK_SIZE
+            results = await asyncio.gather(*(
+                self._call_mcp_tool("insert_rows", {
+                    "table": self.tables['notifications'],
+                    "data": records[i:i + chunk_size]
+                })
+                for i in range(0, len(records), chunk_size)
+            ))
+            
+            return all(result.get('success', False) for result in results)
+            
+        except Exception as e:
+            logger.error(f"Failed to record {len(notifications)} notifications: {e}")
+            return False
+    
+    @staticmethod
+    def _notification_row(notification: NotificationRecord, created_at: str) -> Dict[str, Any]:
+        """
+        Build a notification_records row.
+        
+        Args:
+            notification: Notification record to store
+            created_at: ISO timestamp for the created_at column
+            
+        Returns:
+            Row dict for insert_rows
+        """
+        return {
+            'id': str(uuid4()),
+            **notification.model_dump(mode='json', exclude={'id', 'created_at'}),
+            'created_at': created_at
+        }
+    
     async def check_notification_sent(
         self,
         park: ParkEnum,
@@ -383,22 +717,24 @@ class SupabaseClient:
             bool: True if notification was already sent
         """
         try:
-            cutoff_time = datetime.utcnow() - timedelta(hours=hours_back)
+            # Aware, so asyncpg doesn't read it as host-local time
+            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours_back)
             
             query = f"""
-            SELECT COUNT(*) as count FROM {self.tables['notifications']}
-            WHERE park = '{park.value}'
-            AND site_id = '{site_id}'
-            AND check_in_date = '{check_in_date.isoformat()}'
+            SELECT 1 FROM {self.tables['notifications']}
+            WHERE park = $1::park_enum
+            AND site_id = $2
+            AND check_in_date = $3::date
             AND status = 'sent'
-            AND created_at >= '{cutoff_time.isoformat()}'
+            AND created_at >= $4::timestamptz
+            LIMIT 1
             """
+            params = (park.value, site_id, check_in_date, cutoff_time)
             
-            result = await self._execute_query(query)
+            result = await self._execute_query(query, params)
             
             if result.get('success'):
-                count = result.get('data', [{}])[0].get('count', 0)
-                return count > 0
+                return bool(result.get('data'))
             
             return False
             
@@ -406,6 +742,58 @@ class SupabaseClient:
             logger.error(f"Failed to check notification history: {e}")
             return False
     
+    async def check_notifications_sent_bulk(
+        self,
+        keys: List[Tuple[ParkEnum, str, date]],
+        hours_back: int = 24
+    ) -> Set[Tuple[str, str, str]]:
+        """
+        Check notification history for many site/date combinations in one query.
+        
+        Args:
+            keys: (park, site_id, check_in_date) combinations to check
+            hours_back: Hours to look back for existing notifications
+            
+        Returns:
+            Set of (park value, site_id, ISO check-in date) keys that were
+            already notified; empty if the lookup failed
+        """
+        if not keys:
+            return set()
+        
+        try:
+            # Aware, so asyncpg doesn't read it as host-local time
+            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours_back)
+            unique_keys = {
+                (ParkEnum(park).value, site_id, check_in_date)
+                for park, site_id, check_in_date in keys
+            }
+            parks, site_ids, dates = zip(*unique_keys)
+            
+            query = f"""
+            SELECT DISTINCT park, site_id, check_in_date FROM {self.tables['notifications']}
+            WHERE status = 'sent'
+            AND created_at >= $1::timestamptz
+            AND (park, site_id, check_in_date) IN (
+                SELECT * FROM unnest($2::park_enum[], $3::text[], $4::date[])
+            )
+            """
+            params = (cutoff_time, list(parks), list(site_ids), list(dates))
+            
+            result = await self._execute_query(query, params)
+            
+            if not result.get('success'):
+                raise SupabaseError(f"Query failed: {result.get('error')}")
+            
+            return {
+                (row['park'], row['site_id'], _parse_date(row['check_in_date']).isoformat())
+                for row in result.get('data', [])
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to check notification history for {len(keys)} sites: {e}")
+            return set()
+    
     async def store_scrape_result(self, scrape_result: ScrapeResult) -> bool:
         """
         Store scraping operation result.
@@ -419,7 +807,7 @@ class SupabaseClient:
         try:
             record = {
                 'id': str(uuid4()),
-                'park': scrape_result.park.value,
+                'park': scrape_result.park,
                 'scrape_timestamp': scrape_result.scrape_timestamp.isoformat(),
                 'completed_at': scrape_result.completed_at.isoformat() if scrape_result.completed_at else None,
                 'sites_found': scrape_result.sites_found,
@@ -428,7 +816,8 @@ class SupabaseClient:
                 'warnings': scrape_result.warnings,
                 'processing_time_seconds': scrape_result.processing_time_seconds,
                 'success': scrape_result.success,
-                'raw_data': scrape_result.raw_data,
+                # Raw scrape payloads can be large; only upload them when debugging
+                'raw_data': scrape_result.raw_data if settings.store_raw_data else None,
                 'created_at': datetime.utcnow().isoformat()
             }
             
@@ -460,29 +849,85 @@ class SupabaseClient:
         # For now, simulate MCP calls with direct HTTP to Supabase
         # In production, this would go through the MCP server
         
-        try:
-            if tool_name == "insert_rows":
-                return await self._insert_rows_direct(parameters)
-            elif tool_name == "execute_query":
-                return await self._execute_query_direct(parameters)
-            else:
-                raise SupabaseError(f"Unknown tool: {tool_name}")
+        for attempt in range(1, settings.max_retries + 1):
+            await self.rate_limiter.acquire()
+            
+            try:
+                if tool_name == "insert_rows":
+                    result = await self._insert_rows_direct(parameters)
+                elif tool_name == "execute_query":
+                    result = await self._execute_query_direct(parameters)
+                else:
+                    raise SupabaseError(f"Unknown tool: {tool_name}")
                 
-        except Exception as e:
-            raise SupabaseError(f"MCP tool call failed: {e}")
+                self.rate_limiter.handle_success()
+                return result
+                
+            except Exception as e:
+                if attempt == settings.max_retries or not self._is_transient_error(e):
+                    raise SupabaseError(f"MCP tool call failed: {e}")
+                
+                await self.rate_limiter.handle_error(e)
     
-    async def _execute_query(self, query: str) -> Dict[str, Any]:
-        """Execute a SQL query."""
-        return await self._call_mcp_tool("execute_query", {"query": query})
+    @staticmethod
+    def _is_transient_error(error: Exception) -> bool:
+        """
+        Check whether a failed call is worth retrying.
+        
+        Args:
+            error: Exception raised by the call
+            
+        Returns:
+            bool: True for connection errors, timeouts and PostgreSQL refusing
+            or dropping connections
+        """
+        return isinstance(error, _TRANSIENT_ERRORS)
+    
+    async def _execute_query(self, query: str, params: Tuple[Any, ...] = ()) -> Dict[str, Any]:
+        """
+        Execute a SQL query.
+        
+        Args:
+            query: SQL text, with values referenced as $1, $2, ... placeholders
+            params: Values bound to the placeholders, in order
+            
+        Returns:
+            Tool response data
+        """
+        return await self._call_mcp_tool("execute_query", {"query": query, "params": list(params)})
     
     async def _insert_rows_direct(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Direct implementation of row insertion."""
-        # This is a simplified implementation
-        # In production, this would use the actual Supabase MCP server
-        
         table = parameters.get('table')
         data = parameters.get('data', [])
         
+        pool = await self._get_pool()
+        if pool is not None and data:
+            # Send the batch as one JSON array and let PostgreSQL cast it to the table's row type
+            columns = ", ".join(data[0])
+            query = (
+                f"INSERT INTO {table} ({columns}) "
+                f"SELECT {columns} FROM jsonb_populate_recordset(NULL::{table}, $1::jsonb)"
+            )
+            
+            if parameters.get('on_conflict') == 'update':
+                conflict_columns = parameters.get('conflict_columns', [])
+                updates = ", ".join(
+                    f"{column} = EXCLUDED.{column}" for column in data[0]
+                    if column not in conflict_columns and column not in ('id', 'created_at')
+                )
+                query += f" ON CONFLICT ({', '.join(conflict_columns)}) DO UPDATE SET {updates}"
+            
+            async with pool.acquire() as conn:
+                status = await conn.execute(query, orjson.dumps(data).decode())
+            
+            return {
+                'success': True,
+                'rows_affected': int(status.rsplit(' ', 1)[-1])
+            }
+        
+        # No direct connection configured; in production this would go
+        # through the Supabase MCP server
         logger.info(f"Simulating insert of {len(data)} rows into {table}")
         
         return {
@@ -492,12 +937,24 @@ class SupabaseClient:
     
     async def _execute_query_direct(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Direct implementation of query execution."""
-        # This is a simplified implementation
-        # In production, this would use the actual Supabase MCP server
-        
         query = parameters.get('query')
+        params = parameters.get('params', [])
+        
+        pool = await self._get_pool()
+        if pool is not None:
+            # asyncpg prepares and caches the statement per connection and
+            # returns Records, which support the same row['column'] access
+            async with pool.acquire() as conn:
+                rows = await conn.fetch(query, *params)
+            
+            return {
+                'success': True,
+                'data': rows
+            }
         
-        logger.info(f"Simulating query execution: {query[:100]}...")
+        # No direct connection configured; in production this would go
+        # through the Supabase MCP server
+        logger.info(f"Simulating query execution: {query[:100]}... ({len(params)} params)")
         
         return {
             'success': True,
@@ -8,7 +8,8 @@ Also serves as the web application entry point for deployment.
 import asyncio
 import logging
 import sys
-from typing import List, Optional
+from contextlib import AsyncExitStack
+from typing import List, Optional, Tuple
 from datetime import datetime, date, timedelta
 
 import click
@@ -21,10 +22,15 @@ from .config.parks import ParkEnum, get_all_parks
 from .scraper.crawl4ai_client import Crawl4AIClient
 from .database.supabase_client import SupabaseClient
 from .database.models import CampsiteSearchQuery
-from .notifications.alert_rules import AlertProcessor
+from .notifications.alert_rules import ALERT_RULES_CACHE_TTL, AlertProcessor
 from .notifications.email_alerts import EmailNotificationService
 from .dashboard.calendar_view import dashboard
 
+try:
+    import uvloop
+except ImportError:  # Installed with uvicorn[standard]; fall back to the stock loop
+    uvloop = None
+
 # Setup logging
 logging.basicConfig(
     level=getattr(logging, settings.log_level),
@@ -32,11 +38,38 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Create main FastAPI app
+# Park lookup by CLI value, built once instead of calling ParkEnum(value) per park
+_PARK_BY_VALUE = ParkEnum._value2member_map_
+
+
+def _parse_parks(ctx: click.Context, param: click.Parameter, value: tuple) -> Tuple[ParkEnum, ...]:
+    """
+    Convert --parks values to parks.
+    
+    Args:
+        ctx: Click context
+        param: The --parks option
+        value: Park values given on the command line
+        
+    Returns:
+        Tuple of parks; empty when none were given
+        
+    Raises:
+        click.BadParameter: If a value is not a known park
+    """
+    try:
+        return tuple(_PARK_BY_VALUE[park] for park in value)
+    except KeyError as e:
+        choices = ', '.join(_PARK_BY_VALUE)
+        raise click.BadParameter(f"unknown park {e.args[0]!r} (choose from {choices})")
+
+# Create main FastAPI app; mounted apps get no lifespan events of their own,
+# so the dashboard's startup and shutdown run as this app's lifespan
 app = FastAPI(
     title="Southern California Campsite Tracker",
     description="Monitor and track campsite availability across Southern California state parks",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=dashboard.lifespan
 )
 
 # Add CORS middleware
@@ -59,114 +92,176 @@ def cli():
 
 
 @cli.command()
-@click.option('--parks', multiple=True, help='Specific parks to scrape (default: all)')
+@click.option('--parks', multiple=True, callback=_parse_parks, help='Specific parks to scrape (default: all)')
 @click.option('--days', default=30, help='Number of days ahead to scrape (default: 30)')
 async def scrape(parks: tuple, days: int):
     """Scrape campsite availability data."""
     try:
-        logger.info("Starting campsite availability scraping")
-        
-        # Determine parks to scrape
-        if parks:
-            park_list = [ParkEnum(park) for park in parks]
-        else:
-            park_list = get_all_parks()
-        
-        # Setup clients
-        async with Crawl4AIClient() as scraper, SupabaseClient() as db:
-            
-            # Check MCP server connectivity
-            crawl_healthy = await scraper.health_check()
-            db_healthy = await db.health_check()
-            
-            if not crawl_healthy:
-                logger.error("Crawl4AI MCP server not available")
-                return
-            
-            if not db_healthy:
-                logger.warning("Database connection issues - data may not be stored")
-            
-            # Create search query
-            start_date = date.today()
-            end_date = start_date + timedelta(days=days)
-            
-            query = CampsiteSearchQuery(
-                parks=park_list,
-                start_date=start_date,
-                end_date=end_date
-            )
-            
-            # Scrape each park
-            total_scraped = 0
-            for park in park_list:
-                try:
-                    logger.info(f"Scraping {park.value}")
-                    
-                    availability = await scraper.scrape_park_availability(
-                        park, (start_date, end_date)
-                    )
-                    
-                    if availability and db_healthy:
-                        await db.store_availability_data(availability)
-                        total_scraped += len(availability)
-                        logger.info(f"Stored {len(availability)} records for {park.value}")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to scrape {park.value}: {e}")
-                    continue
-            
-            logger.info(f"Scraping complete. Total records: {total_scraped}")
+        await run_scrape(parks, days)
     
     except Exception as e:
         logger.error(f"Scraping failed: {e}")
         sys.exit(1)
 
 
+async def run_scrape(
+    parks: tuple,
+    days: int,
+    scraper: Optional[Crawl4AIClient] = None,
+    db: Optional[SupabaseClient] = None
+) -> None:
+    """
+    Scrape and store availability for the given parks.
+    
+    Args:
+        parks: Parks to scrape; empty for all parks
+        days: Number of days ahead to scrape
+        scraper: Open scraper client to reuse; one is opened for this run if omitted
+        db: Open database client to reuse; one is opened for this run if omitted
+    """
+    logger.info("Starting campsite availability scraping")
+    
+    # Determine parks to scrape
+    park_list = parks or get_all_parks()
+    
+    # Setup clients, reusing the caller's when given
+    async with AsyncExitStack() as stack:
+        if scraper is None:
+            scraper = await stack.enter_async_context(Crawl4AIClient())
+        if db is None:
+            db = await stack.enter_async_context(SupabaseClient())
+        
+        # Check MCP server connectivity
+        crawl_healthy = await scraper.health_check()
+        db_healthy = await db.health_check()
+        
+        if not crawl_healthy:
+            logger.error("Crawl4AI MCP server not available")
+            return
+        
+        if not db_healthy:
+            logger.warning("Database connection issues - data may not be stored")
+        
+        # Create search query
+        start_date = date.today()
+        end_date = start_date + timedelta(days=days)
+        
+        query = CampsiteSearchQuery(
+            parks=park_list,
+            start_date=start_date,
+            end_date=end_date
+        )
+        
+        # Scrape parks concurrently, bounded to the scraper's connection budget
+        semaphore = asyncio.Semaphore(settings.scrape_concurrency)
+        
+        async def scrape_one(park: ParkEnum) -> int:
+            async with semaphore:
+                logger.info(f"Scraping {park.value}")
+                
+                availability = await scraper.scrape_park_availability(
+                    park, (start_date, end_date)
+                )
+                
+                if availability and db_healthy:
+                    await db.store_availability_data(availability)
+                    logger.info(f"Stored {len(availability)} records for {park.value}")
+                    return len(availability)
+                
+                return 0
+        
+        results = await asyncio.gather(
+            *(scrape_one(park) for park in park_list),
+            return_exceptions=True
+        )
+        
+        total_scraped = 0
+        for park, result in zip(park_list, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to scrape {park.value}: {result}")
+                continue
+            total_scraped += result
+        
+        logger.info(f"Scraping complete. Total records: {total_scraped}")
+
+
 @cli.command()
 async def process_alerts():
     """Process alert rules and send notifications."""
     try:
-        logger.info("Processing alert rules")
+        await run_process_alerts()
+    
+    except Exception as e:
+        logger.error(f"Alert processing failed: {e}")
+        sys.exit(1)
+
+
+async def run_process_alerts(
+    db: Optional[SupabaseClient] = None,
+    email_service: Optional[EmailNotificationService] = None
+) -> None:
+    """
+    Match recent availability against alert rules and send notifications.
+    
+    Args:
+        db: Open database client to reuse; one is opened for this run if omitted
+        email_service: Open email service to reuse; one is opened for this run if omitted
+    """
+    logger.info("Processing alert rules")
+    
+    async with AsyncExitStack() as stack:
+        if db is None:
+            db = await stack.enter_async_context(SupabaseClient())
+        if email_service is None:
+            email_service = await stack.enter_async_context(EmailNotificationService())
         
-        async with SupabaseClient() as db:
-            
-            # Check database connectivity
-            if not await db.health_check():
-                logger.error("Database not available")
-                return
-            
-            # Get recent availability data (last 2 hours)
-            cutoff_time = datetime.utcnow() - timedelta(hours=2)
-            
-            all_availability = []
-            for park in get_all_parks():
-                availability = await db.get_availability_by_park(
+        # Check database connectivity
+        if not await db.health_check():
+            logger.error("Database not available")
+            return
+        
+        # Get recent availability data (last 2 hours)
+        cutoff_time = datetime.utcnow() - timedelta(hours=2)
+        
+        # Fetch all parks concurrently
+        parks = get_all_parks()
+        today = date.today()
+        results = await asyncio.gather(
+            *(
+                db.get_availability_by_park(
                     park,
-                    start_date=date.today(),
-                    end_date=date.today() + timedelta(days=7)
+                    start_date=today,
+                    end_date=today + timedelta(days=7)
                 )
-                
-                # Filter to recent data
-                recent_availability = [
-                    avail for avail in availability
-                    if avail.scraped_at >= cutoff_time
-                ]
-                
-                all_availability.extend(recent_availability)
-            
-            if not all_availability:
-                logger.info("No recent availability data found")
-                return
+                for park in parks
+            ),
+            return_exceptions=True
+        )
+        
+        all_availability = []
+        for park, availability in zip(parks, results):
+            if isinstance(availability, Exception):
+                logger.error(f"Failed to fetch availability for {park.value}: {availability}")
+                continue
             
-            # Process alerts
-            alert_processor = AlertProcessor(db)
+            # Filter to recent data
+            all_availability.extend(
+                avail for avail in availability
+                if avail.scraped_at >= cutoff_time
+            )
+        
+        if not all_availability:
+            logger.info("No recent availability data found")
+            return
+        
+        # Process alerts
+        alert_processor = AlertProcessor(db, email_service)
+        try:
             stats = await alert_processor.process_new_availability(all_availability)
-            
-            logger.info(f"Alert processing complete: {stats}")
-    
-    except Exception as e:
-        logger.error(f"Alert processing failed: {e}")
-        sys.exit(1)
+        finally:
+            await alert_processor.close()
+        
+        logger.info(f"Alert processing complete: {stats}")
 
 
 @cli.command()
@@ -199,21 +294,25 @@ async def worker():
     try:
         logger.info("Starting background worker")
         
-        while True:
-            try:
-                # Run scraping
-                await scrape.callback(parks=(), days=30)
-                
-                # Wait 5 minutes then process alerts
-                await asyncio.sleep(300)
-                await process_alerts.callback()
-                
-                # Wait remainder of 30 minutes
-                await asyncio.sleep(1500)  # 25 minutes
-                
-            except Exception as e:
-                logger.error(f"Worker cycle failed: {e}")
-                await asyncio.sleep(600)  # Wait 10 minutes on error
+        # Keep clients open across cycles so connections are reused
+        async with (
+            Crawl4AIClient() as scraper,
+            SupabaseClient() as db,
+            EmailNotificationService() as email_service
+        ):
+            
+            # Scraping and alert processing run on independent schedules
+            async with asyncio.TaskGroup() as tasks:
+                tasks.create_task(_run_periodically(
+                    "scrape",
+                    lambda: run_scrape(parks=(), days=30, scraper=scraper, db=db),
+                    settings.scrape_interval_minutes * 60
+                ))
+                tasks.create_task(_run_periodically(
+                    "alert processing",
+                    lambda: run_process_alerts(db=db, email_service=email_service),
+                    settings.alert_interval_minutes * 60
+                ))
     
     except KeyboardInterrupt:
         logger.info("Worker stopped")
@@ -222,6 +321,24 @@ async def worker():
         sys.exit(1)
 
 
+async def _run_periodically(name: str, job, interval_seconds: int) -> None:
+    """
+    Run a worker job forever, waiting interval_seconds after each run.
+    
+    Args:
+        name: Job name for logging
+        job: Zero-argument coroutine function to run
+        interval_seconds: Delay between the end of one run and the next
+    """
+    while True:
+        try:
+            await job()
+        except Exception as e:
+            logger.error(f"Worker {name} cycle failed: {e}")
+        
+        await asyncio.sleep(interval_seconds)
+
+
 @cli.command()
 async def setup():
     """Setup database and initial configuration."""
@@ -259,7 +376,7 @@ async def setup():
 
 @cli.command()
 @click.option('--email', required=True, help='Email address for alerts')
-@click.option('--parks', multiple=True, help='Parks to monitor (default: all)')
+@click.option('--parks', multiple=True, callback=_parse_parks, help='Parks to monitor (default: all)')
 @click.option('--weekend-only', is_flag=True, help='Only alert for weekend availability')
 async def create_alert(email: str, parks: tuple, weekend_only: bool):
     """Create a new alert rule."""
@@ -267,10 +384,7 @@ async def create_alert(email: str, parks: tuple, weekend_only: bool):
         from .database.models import AlertRule, SiteTypeEnum
         
         # Determine parks
-        if parks:
-            park_list = [ParkEnum(park) for park in parks]
-        else:
-            park_list = get_all_parks()
+        park_list = parks or get_all_parks()
         
         # Create alert rule
         alert_rule = AlertRule(
@@ -284,7 +398,12 @@ async def create_alert(email: str, parks: tuple, weekend_only: bool):
         
         async with SupabaseClient() as db:
             rule_id = await db.create_alert_rule(alert_rule)
-            logger.info(f"Created alert rule {rule_id} for {email}")
+            # A running worker caches active rules, so it picks this one up on
+            # its first run after the cache expires
+            logger.info(
+                f"Created alert rule {rule_id} for {email}; "
+                f"active within {ALERT_RULES_CACHE_TTL}s"
+            )
     
     except Exception as e:
         logger.error(f"Failed to create alert rule: {e}")
@@ -293,9 +412,12 @@ async def create_alert(email: str, parks: tuple, weekend_only: bool):
 
 # Make CLI async-compatible
 def run_async_command(func):
-    """Run async click command."""
+    """Run async click command, on uvloop when it is available."""
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    
     def wrapper(*args, **kwargs):
-        return asyncio.run(func(*args, **kwargs))
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(func(*args, **kwargs))
     return wrapper
 
 # Wrap async commands
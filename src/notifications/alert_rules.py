@@ -6,8 +6,11 @@ and determining when notifications should be sent.
 """
 
 import asyncio
+import itertools
 import logging
-from typing import List, Dict, Any, Optional, Tuple, Set
+import operator
+import time
+from typing import List, Dict, Any, FrozenSet, Optional, Tuple, Set
 from datetime import datetime, date, timedelta
 from collections import defaultdict
 
@@ -26,6 +29,14 @@ from .email_alerts import EmailNotificationService
 
 logger = logging.getLogger(__name__)
 
+# Active alert rules change rarely; reuse them across processors for this many
+# seconds. Rules are created by other processes, so this is also how long a new
+# rule can take to reach a running worker
+ALERT_RULES_CACHE_TTL = 60
+
+# (fetched_at monotonic time, rules), shared by every AlertProcessor in the process
+_rules_cache: Optional[Tuple[float, List[AlertRule]]] = None
+
 
 class AlertProcessor:
     """
@@ -50,8 +61,17 @@ class AlertProcessor:
         self.email_service = email_service or EmailNotificationService()
         
         # Tracking for batch processing
-        self.processed_notifications: Set[str] = set()
+        # (park, site_id, ISO date) keys notified by this processor, same shape as
+        # the keys returned by check_notifications_sent_bulk
+        self.processed_notifications: Set[Tuple[str, str, str]] = set()
         self.notification_batch: List[NotificationRecord] = []
+        self._pending_store: Optional[asyncio.Task] = None
+        
+        # Available dates per (park, site_id), built once per availability batch
+        self._by_site: Dict[Tuple[str, str], Set[date]] = {}
+        self._weekend_days: FrozenSet[date] = frozenset()
+        self._today_ordinal = date.today().toordinal()
+        self._by_site_source: Optional[List[CampsiteAvailability]] = None
     
     async def process_new_availability(
         self,
@@ -71,6 +91,9 @@ class AlertProcessor:
         
         logger.info(f"Processing {len(availability)} availability records against alert rules")
         
+        # Index available dates per site and the batch's weekend days once
+        self._build_site_index(availability)
+        
         stats = {
             'notifications_sent': 0,
             'rules_processed': 0,
@@ -82,39 +105,46 @@ class AlertProcessor:
         
         try:
             # Get all active alert rules
-            alert_rules = await self.db_client.get_active_alert_rules()
+            alert_rules = await self._get_active_alert_rules()
             stats['rules_processed'] = len(alert_rules)
             
             if not alert_rules:
                 logger.info("No active alert rules found")
                 return stats
             
-            # Filter for weekend sites if any rules care about weekends
-            weekend_availability = [
-                site for site in availability
-                if self.is_weekend_date(site.check_in_date)
-                and site.status == AvailabilityStatus.AVAILABLE
-            ]
-            stats['weekend_sites_found'] = len(weekend_availability)
+            # Count weekend sites only if some rule cares about weekends
+            if any(rule.weekend_only for rule in alert_rules):
+                weekend_days = self._weekend_days
+                stats['weekend_sites_found'] = sum(
+                    1 for site in availability
+                    if site.check_in_date in weekend_days
+                    and site.status == AvailabilityStatus.AVAILABLE
+                )
+            
+            # Look up notification history for every available site once, shared by all rules
+            already_notified = await self._get_already_notified(availability)
             
-            # Process each alert rule
+            # Match every rule first; matching is in memory once history is loaded
+            matched_rules = []
             for rule in alert_rules:
                 try:
-                    matches = await self.find_matching_availability(rule, availability)
-                    
-                    if matches:
-                        stats['rules_matched'] += 1
-                        notification_sent = await self.send_alert_notification(rule, matches)
-                        
-                        if notification_sent:
-                            stats['notifications_sent'] += 1
-                        
+                    matches = await self.find_matching_availability(rule, availability, already_notified)
                 except Exception as e:
                     error_msg = f"Error processing rule {rule.id}: {e}"
                     logger.error(error_msg)
                     stats['errors'].append(error_msg)
+                    continue
+                
+                if matches:
+                    matched_rules.append((rule, matches))
+            
+            stats['rules_matched'] = len(matched_rules)
             
-            # Batch store notification records
+            # Send every rule's alerts as one batch so identical emails are sent once
+            notifications_sent = await self._send_alerts(matched_rules)
+            stats['notifications_sent'] = sum(notifications_sent)
+            
+            # Batch store notification records in the background
             if self.notification_batch:
                 await self._store_notification_batch()
             
@@ -127,10 +157,32 @@ class AlertProcessor:
             stats['errors'].append(error_msg)
             return stats
     
+    async def _get_active_alert_rules(self) -> List[AlertRule]:
+        """
+        Get active alert rules, reusing a recent fetch when one is cached.
+        
+        Returns:
+            List of active alert rules
+        """
+        global _rules_cache
+        now = time.monotonic()
+        
+        if _rules_cache is not None and now - _rules_cache[0] < ALERT_RULES_CACHE_TTL:
+            return _rules_cache[1]
+        
+        alert_rules = await self.db_client.get_active_alert_rules()
+        
+        # An empty list may be a failed query, so only cache real results
+        if alert_rules:
+            _rules_cache = (now, alert_rules)
+        
+        return alert_rules
+    
     async def find_matching_availability(
         self,
         alert_rule: AlertRule,
-        availability: List[CampsiteAvailability]
+        availability: List[CampsiteAvailability],
+        already_notified: Optional[Set[Tuple[str, str, str]]] = None
     ) -> List[CampsiteAvailability]:
         """
         Find availability that matches an alert rule.
@@ -138,10 +190,23 @@ class AlertProcessor:
         Args:
             alert_rule: Alert rule to match against
             availability: List of availability to check
+            already_notified: (park, site_id, ISO date) keys notified within the
+                cooldown; looked up here when not supplied
             
         Returns:
             List of matching availability
         """
+        if already_notified is None:
+            already_notified = await self._get_already_notified(availability)
+        
+        if self._by_site_source is not availability:
+            self._build_site_index(availability)
+        
+        # Build the rule's park and site type filters once for all sites
+        rule_parks = frozenset(alert_rule.parks)
+        rule_site_types = frozenset(SiteTypeEnum(st) for st in alert_rule.site_types)
+        
+        processed = self.processed_notifications
         matches = []
         
         for site in availability:
@@ -149,28 +214,49 @@ class AlertProcessor:
             if site.status != AvailabilityStatus.AVAILABLE:
                 continue
             
-            # Check if we already sent notification for this site/date
-            already_notified = await self.db_client.check_notification_sent(
-                site.park,
-                site.site_id,
-                site.check_in_date,
-                settings.alert_cooldown_hours
-            )
-            
-            if already_notified:
+            # Check if we already sent notification for this site/date, either
+            # earlier in this run or within the cooldown
+            key = (site.park, site.site_id, site.check_in_date.isoformat())
+            if key in processed or key in already_notified:
                 continue
             
             # Check rule criteria
-            if await self._matches_alert_rule(alert_rule, site, availability):
+            if self._matches_alert_rule(
+                alert_rule, site, availability, rule_parks, rule_site_types
+            ):
                 matches.append(site)
         
         return matches
     
-    async def _matches_alert_rule(
+    async def _get_already_notified(
+        self,
+        availability: List[CampsiteAvailability]
+    ) -> Set[Tuple[str, str, str]]:
+        """
+        Get the available sites that were already notified within the cooldown.
+        
+        Args:
+            availability: List of availability to check
+            
+        Returns:
+            Set of (park, site_id, ISO date) keys, from one bulk query
+        """
+        keys = [
+            (site.park, site.site_id, site.check_in_date)
+            for site in availability
+            if site.status == AvailabilityStatus.AVAILABLE
+        ]
+        return await self.db_client.check_notifications_sent_bulk(
+            keys, settings.alert_cooldown_hours
+        )
+    
+    def _matches_alert_rule(
         self,
         rule: AlertRule,
         site: CampsiteAvailability,
-        all_availability: List[CampsiteAvailability]
+        all_availability: List[CampsiteAvailability],
+        rule_parks: FrozenSet[str],
+        rule_site_types: FrozenSet[SiteTypeEnum]
     ) -> bool:
         """
         Check if a specific site matches an alert rule.
@@ -179,20 +265,22 @@ class AlertProcessor:
             rule: Alert rule to check
             site: Campsite availability to check
             all_availability: All availability data for consecutive nights check
+            rule_parks: The rule's parks, precomputed once per rule
+            rule_site_types: The rule's site types, precomputed once per rule
             
         Returns:
             bool: True if site matches rule
         """
         # Check park filter
-        if site.park not in rule.parks:
+        if site.park not in rule_parks:
             return False
         
         # Check site type filter
-        if site.site_type not in [SiteTypeEnum(st) for st in rule.site_types]:
+        if site.site_type not in rule_site_types:
             return False
         
         # Check weekend filter
-        if rule.weekend_only and not self.is_weekend_date(site.check_in_date):
+        if rule.weekend_only and site.check_in_date not in self._weekend_days:
             return False
         
         # Check price filter
@@ -200,7 +288,7 @@ class AlertProcessor:
             return False
         
         # Check advance notice
-        days_ahead = (site.check_in_date - date.today()).days
+        days_ahead = site.check_in_date.toordinal() - self._today_ordinal
         if days_ahead < rule.advance_notice_days:
             return False
         
@@ -231,33 +319,38 @@ class AlertProcessor:
         Returns:
             bool: True if consecutive nights are available
         """
-        # Find all availability for this park and site
-        site_availability = [
-            avail for avail in all_availability
-            if (avail.park == site.park and 
-                avail.site_id == site.site_id and
-                avail.status == AvailabilityStatus.AVAILABLE)
-        ]
+        # Every night from check-in through min_nights - 1 must be available
+        dates = self._by_site.get((site.park, site.site_id), ())
+        check_in = site.check_in_date
+        return all(check_in + timedelta(days=i) in dates for i in range(min_nights))
+    
+    def _build_site_index(self, availability: List[CampsiteAvailability]) -> None:
+        """
+        Index available check-in dates by (park, site_id) and collect the weekend days.
         
-        # Sort by date
-        site_availability.sort(key=lambda x: x.check_in_date)
+        Args:
+            availability: Availability data to index
+        """
+        by_site = defaultdict(set)
+        for avail in availability:
+            if avail.status == AvailabilityStatus.AVAILABLE:
+                by_site[(avail.park, avail.site_id)].add(avail.check_in_date)
         
-        # Find consecutive sequence starting from site.check_in_date
-        consecutive_count = 0
-        current_date = site.check_in_date
+        # The batch spans a few weeks at most, so precompute its weekend days
+        # once and turn every weekend check into a set lookup
+        weekend_days = frozenset()
+        if availability:
+            first = min(avail.check_in_date for avail in availability)
+            last = max(avail.check_in_date for avail in availability)
+            days = (first + timedelta(days=i) for i in range((last - first).days + 1))
+            weekend_days = frozenset(day for day in days if self.is_weekend_date(day))
         
-        for avail in site_availability:
-            if avail.check_in_date == current_date:
-                consecutive_count += 1
-                current_date += timedelta(days=1)
-                
-                if consecutive_count >= min_nights:
-                    return True
-            elif avail.check_in_date > current_date:
-                # Gap in availability, reset count
-                break
+        self._by_site = by_site
+        self._weekend_days = weekend_days
+        self._by_site_source = availability
         
-        return consecutive_count >= min_nights
+        # Read the clock once per batch for the advance-notice checks
+        self._today_ordinal = date.today().toordinal()
     
     def is_weekend_date(self, check_date: date) -> bool:
         """
@@ -287,53 +380,113 @@ class AlertProcessor:
         Returns:
             bool: True if notification was sent successfully
         """
+        notifications_sent = await self._send_alerts([(alert_rule, matching_sites)])
+        return notifications_sent[0]
+    
+    async def _send_alerts(
+        self,
+        matched_rules: List[Tuple[AlertRule, List[CampsiteAvailability]]]
+    ) -> List[bool]:
+        """
+        Send notifications for several matched rules in one email batch.
+        
+        Args:
+            matched_rules: (alert rule, matching sites) pairs
+            
+        Returns:
+            List of bool, True where the rule had a notification sent
+        """
+        notifications_sent = [False] * len(matched_rules)
+        
+        # Send separate emails for each park to avoid overwhelming messages,
+        # limiting sites per email to avoid spam
+        alerts = []
+        owners = []
+        for owner, (alert_rule, matching_sites) in enumerate(matched_rules):
+            for chunk in self._chunk_sites(matching_sites):
+                alerts.append((alert_rule, chunk))
+                owners.append(owner)
+        
+        if not alerts:
+            return notifications_sent
+        
         try:
-            # Group sites by park for better email organization
-            sites_by_park = defaultdict(list)
-            for site in matching_sites:
-                sites_by_park[site.park].append(site)
-            
-            # Send separate emails for each park to avoid overwhelming messages
-            notifications_sent = 0
-            
-            for park, sites in sites_by_park.items():
-                # Limit sites per email to avoid spam
-                max_sites_per_email = 10
-                site_chunks = [
-                    sites[i:i + max_sites_per_email]
-                    for i in range(0, len(sites), max_sites_per_email)
-                ]
+            records = await self.email_service.send_availability_alerts(alerts)
+        except Exception as e:
+            logger.error(f"Failed to send alert notifications: {e}")
+            return notifications_sent
+        
+        for owner, (alert_rule, chunk), notification_record in zip(owners, alerts, records):
+            # Add to batch for storage
+            self.notification_batch.append(notification_record)
+            
+            if notification_record.status == NotificationStatus.SENT:
+                notifications_sent[owner] = True
                 
-                for chunk in site_chunks:
-                    notification_record = await self.email_service.send_availability_alert(
-                        alert_rule, chunk
-                    )
-                    
-                    # Add to batch for storage
-                    self.notification_batch.append(notification_record)
-                    
-                    if notification_record.status == NotificationStatus.SENT:
-                        notifications_sent += 1
-                        
-                        # Track to prevent duplicates in this batch
-                        for site in chunk:
-                            key = f"{site.park}_{site.site_id}_{site.check_in_date}"
-                            self.processed_notifications.add(key)
-            
-            return notifications_sent > 0
+                # Track to prevent duplicates in this batch
+                self.processed_notifications.update(
+                    (site.park, site.site_id, site.check_in_date.isoformat())
+                    for site in chunk
+                )
+        
+        return notifications_sent
+    
+    @staticmethod
+    def _chunk_sites(
+        matching_sites: List[CampsiteAvailability],
+        max_sites_per_email: int = 10
+    ) -> List[List[CampsiteAvailability]]:
+        """
+        Split matching sites into per-park email chunks.
+        
+        Args:
+            matching_sites: Sites that matched a rule
+            max_sites_per_email: Most sites listed in one email
             
-        except Exception as e:
-            logger.error(f"Failed to send alert notification: {e}")
-            return False
+        Returns:
+            List of site chunks, each from a single park
+        """
+        # Group sites by park for better email organization (stable sort keeps
+        # each park's sites in their original order)
+        by_park = operator.attrgetter('park')
+        sites_by_park = [
+            list(sites)
+            for _, sites in itertools.groupby(sorted(matching_sites, key=by_park), key=by_park)
+        ]
+        
+        return [
+            sites[i:i + max_sites_per_email]
+            for sites in sites_by_park
+            for i in range(0, len(sites), max_sites_per_email)
+        ]
+    
+    async def close(self) -> None:
+        """Wait for any in-flight notification store to finish."""
+        if self._pending_store is not None:
+            await self._pending_store
+            self._pending_store = None
     
     async def _store_notification_batch(self) -> None:
-        """Store batched notification records."""
+        """Start storing batched notification records without waiting for the insert."""
+        # Keep a single store in flight so batches are written in order
+        await self.close()
+        
+        batch, self.notification_batch = self.notification_batch, []
+        self._pending_store = asyncio.create_task(self._write_notification_batch(batch))
+    
+    async def _write_notification_batch(self, batch: List[NotificationRecord]) -> None:
+        """
+        Insert a batch of notification records.
+        
+        Args:
+            batch: Notification records to store
+        """
         try:
-            for notification in self.notification_batch:
-                await self.db_client.record_notification(notification)
+            if not await self.db_client.record_notifications_bulk(batch):
+                logger.error(f"Failed to store {len(batch)} notification records")
+                return
             
-            logger.info(f"Stored {len(self.notification_batch)} notification records")
-            self.notification_batch.clear()
+            logger.info(f"Stored {len(batch)} notification records")
             
         except Exception as e:
             logger.error(f"Failed to store notification batch: {e}")
@@ -362,26 +515,29 @@ class AlertProcessor:
                 'parks': []
             }
             
-            # Get availability for each park
-            for park in ParkEnum:
-                park_availability = await self.db_client.get_availability_by_park(
+            # Get availability for all parks concurrently
+            parks = list(ParkEnum)
+            results = await asyncio.gather(*(
+                self.db_client.get_availability_by_park(
                     park,
                     start_date=target_date,
                     end_date=target_date,
                     status_filter=[AvailabilityStatus.AVAILABLE]
                 )
+                for park in parks
+            ))
+            
+            # Every row is for target_date, so the weekend test is the same for all of them
+            target_is_weekend = self.is_weekend_date(target_date)
+            
+            for park, park_availability in zip(parks, results):
+                weekend_count = len(park_availability) if target_is_weekend else 0
                 
-                weekend_count = sum(
-                    1 for site in park_availability
-                    if self.is_weekend_date(site.check_in_date)
+                lowest_price = min(
+                    (site.price for site in park_availability if site.price),
+                    default=None
                 )
                 
-                lowest_price = None
-                if park_availability:
-                    prices = [site.price for site in park_availability if site.price]
-                    if prices:
-                        lowest_price = min(prices)
-                
                 park_info = get_park_info(park)
                 park_summary = {
                     'name': park_info.display_name,
@@ -6,8 +6,10 @@ is found according to user-defined alert rules.
 """
 
 import asyncio
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Set, Tuple
 from datetime import datetime
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -15,7 +17,7 @@ from email.mime.base import MIMEBase
 from email.utils import formatdate
 
 import aiosmtplib
-from jinja2 import Environment, BaseLoader, Template
+from jinja2 import Environment, BaseLoader, FileSystemBytecodeCache, Template
 
 from ..config.settings import settings
 from ..config.parks import get_park_info
@@ -23,27 +25,43 @@ from ..database.models import CampsiteAvailability, AlertRule, NotificationRecor
 
 logger = logging.getLogger(__name__)
 
+# Rendered availability alerts kept for reuse by identical alerts
+RENDER_CACHE_SIZE = 256
 
-class EmailTemplateLoader(BaseLoader):
-    """Custom Jinja2 template loader for email templates."""
+# Options that change how email templates compile. They are part of the
+# bytecode cache file names, so changing them never loads stale bytecode.
+_TEMPLATE_OPTIONS = {'trim_blocks': True, 'lstrip_blocks': True}
+_TEMPLATE_OPTIONS_DIGEST = hashlib.sha1(repr(sorted(_TEMPLATE_OPTIONS.items())).encode()).hexdigest()[:12]
+
+def _now_floor_minute() -> datetime:
+    """
+    Get the current UTC time truncated to the minute, for display in emails.
     
-    def __init__(self):
-        self.templates = {
-            'availability_alert': self._get_availability_alert_template(),
-            'daily_summary': self._get_daily_summary_template(),
-            'error_notification': self._get_error_notification_template()
-        }
+    Returns:
+        datetime: Current UTC time with seconds and microseconds zeroed
+    """
+    return datetime.utcnow().replace(second=0, microsecond=0)
+
+
+def _build_mime_parts(html_content: str, text_content: str) -> Tuple[MIMEText, MIMEText]:
+    """
+    Encode the plain text and HTML alternatives of an email.
     
-    def get_source(self, environment, template):
-        if template not in self.templates:
-            raise FileNotFoundError(f"Template {template} not found")
-        
-        source = self.templates[template]
-        return source, None, lambda: True
+    The parts are never modified after encoding, so messages to different
+    recipients can share them.
     
-    def _get_availability_alert_template(self) -> str:
-        """Email template for availability alerts."""
-        return """
+    Args:
+        html_content: HTML email content
+        text_content: Plain text email content
+        
+    Returns:
+        Tuple of (text part, HTML part)
+    """
+    return MIMEText(text_content, 'plain', 'utf-8'), MIMEText(html_content, 'html', 'utf-8')
+
+
+# Email template for availability alerts
+AVAILABILITY_ALERT_TEMPLATE = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -115,17 +133,17 @@ class EmailTemplateLoader(BaseLoader):
         
         <div class="footer">
             <p>This alert was generated by the Southern California Campsite Tracker</p>
-            <p>Sent at {{ sent_time.strftime('%Y-%m-%d %H:%M:%S %Z') }}</p>
+            <p>Sent at {{ sent_time.strftime('%Y-%m-%d %H:%M %Z') }}</p>
             <p><small>You're receiving this because you have an active alert rule. To manage your alerts, contact the administrator.</small></p>
         </div>
     </div>
 </body>
 </html>
-        """.strip()
-    
-    def _get_daily_summary_template(self) -> str:
-        """Daily summary email template."""
-        return """
+""".strip()
+
+
+# Daily summary email template
+DAILY_SUMMARY_TEMPLATE = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -188,16 +206,16 @@ class EmailTemplateLoader(BaseLoader):
         
         <div class="footer">
             <p>Southern California Campsite Tracker - Daily Summary</p>
-            <p>Generated at {{ sent_time.strftime('%Y-%m-%d %H:%M:%S %Z') }}</p>
+            <p>Generated at {{ sent_time.strftime('%Y-%m-%d %H:%M %Z') }}</p>
         </div>
     </div>
 </body>
 </html>
-        """.strip()
-    
-    def _get_error_notification_template(self) -> str:
-        """Error notification email template."""
-        return """
+""".strip()
+
+
+# Error notification email template
+ERROR_NOTIFICATION_TEMPLATE = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -245,8 +263,122 @@ class EmailTemplateLoader(BaseLoader):
     </div>
 </body>
 </html>
-        """.strip()
+""".strip()
+
+
+# Plain text alternative of the availability alert template
+AVAILABILITY_ALERT_TEXT_TEMPLATE = """
+Campsite Available! - {{ park_display_name }}
+{% if is_weekend %}
+
+WEEKEND AVAILABILITY! These sites are available for weekend camping.
+{% endif %}
+
+Great news! We found {{ site_count }} available campsite{{ 's' if site_count != 1 else '' }} that match{{ '' if site_count != 1 else 'es' }} your alert preferences:
+{% for site in sites %}
+
+{{ site.site_name }}
+  Site ID: {{ site.site_id }}
+  Type: {{ site.site_type|title }}
+  Check-in: {{ site.check_in_date.strftime('%A, %B %d, %Y') }}
+{% if site.max_occupancy %}
+  Max Occupancy: {{ site.max_occupancy }} people
+{% endif %}
+{% if site.amenities %}
+  Amenities: {{ site.amenities|join(', ') }}
+{% endif %}
+{% if site.price %}
+  Price: ${{ "%.2f"|format(site.price) }} per night
+{% endif %}
+{% if site.url %}
+  Book now: {{ site.url }}
+{% endif %}
+{% endfor %}
+
+Act fast! Popular California state park campsites book very quickly, especially weekend spots. We recommend booking immediately if you're interested.
+
+Booking tips:
+- Have your payment information ready
+- Consider booking multiple nights if available
+- Check cancellation policies before booking
+- Popular parks like Joshua Tree fill up within minutes
+
+--
+This alert was generated by the Southern California Campsite Tracker
+Sent at {{ sent_time.strftime('%Y-%m-%d %H:%M %Z') }}
+You're receiving this because you have an active alert rule. To manage your alerts, contact the administrator.
+""".strip()
+
+
+# Plain text alternative of the daily summary template
+DAILY_SUMMARY_TEXT_TEMPLATE = """
+Daily Campsite Summary - {{ summary_date.strftime('%A, %B %d, %Y') }}
+
+Today's highlights:
+  Available sites: {{ total_available }}
+  Weekend available: {{ weekend_available }}
+  Alerts sent: {{ notifications_sent }}
+
+Park availability:
+{% for park_data in parks %}
+
+{{ park_data.name }}
+  Available sites: {{ park_data.available_count }}
+  Weekend sites: {{ park_data.weekend_count }}
+{% if park_data.lowest_price %}
+  Lowest price: ${{ "%.2f"|format(park_data.lowest_price) }}
+{% endif %}
+{% endfor %}
+
+--
+Southern California Campsite Tracker - Daily Summary
+Generated at {{ sent_time.strftime('%Y-%m-%d %H:%M %Z') }}
+""".strip()
+
 
+# Plain text alternative of the error notification template
+ERROR_NOTIFICATION_TEXT_TEMPLATE = """
+System Error Detected
+
+An error occurred in the Southern California Campsite Tracker:
+
+Component: {{ component }}
+Error Type: {{ error_type }}
+Time: {{ error_time.strftime('%Y-%m-%d %H:%M:%S %Z') }}
+Message: {{ error_message }}
+{% if traceback %}
+
+Technical details:
+{{ traceback }}
+{% endif %}
+
+The system will continue attempting to operate normally. If errors persist, manual intervention may be required.
+
+--
+Southern California Campsite Tracker - Error Notification
+""".strip()
+
+
+class EmailTemplateLoader(BaseLoader):
+    """Custom Jinja2 template loader for email templates."""
+    
+    def __init__(self):
+        self.templates = {
+            'availability_alert': AVAILABILITY_ALERT_TEMPLATE,
+            'daily_summary': DAILY_SUMMARY_TEMPLATE,
+            'error_notification': ERROR_NOTIFICATION_TEMPLATE,
+            'availability_alert.txt': AVAILABILITY_ALERT_TEXT_TEMPLATE,
+            'daily_summary.txt': DAILY_SUMMARY_TEXT_TEMPLATE,
+            'error_notification.txt': ERROR_NOTIFICATION_TEXT_TEMPLATE
+        }
+    
+    def get_source(self, environment, template):
+        if template not in self.templates:
+            raise FileNotFoundError(f"Template {template} not found")
+        
+        source = self.templates[template]
+        return source, None, lambda: True
+            
 
 class EmailNotificationService:
     """
@@ -262,8 +394,39 @@ class EmailNotificationService:
         self.smtp_username = settings.smtp_username
         self.smtp_password = settings.smtp_password
         
-        # Initialize Jinja2 environment
-        self.template_env = Environment(loader=EmailTemplateLoader())
+        # Keep compiled templates on disk so new processes skip recompiling them
+        try:
+            bytecode_cache = FileSystemBytecodeCache(
+                pattern=f"__jinja2_email_{_TEMPLATE_OPTIONS_DIGEST}_%s.cache"
+            )
+        except (OSError, RuntimeError) as e:
+            logger.warning(f"Template bytecode cache unavailable: {e}")
+            bytecode_cache = None
+        
+        # Initialize Jinja2 environment and compile each template once; the
+        # sources are constants, so skip the freshness check on lookups and
+        # never evict, and drop the whitespace around block tags from output
+        self.template_env = Environment(
+            loader=EmailTemplateLoader(),
+            bytecode_cache=bytecode_cache,
+            auto_reload=False,
+            cache_size=-1,
+            **_TEMPLATE_OPTIONS
+        )
+        self.availability_template = self.template_env.get_template('availability_alert')
+        self.daily_summary_template = self.template_env.get_template('daily_summary')
+        self.error_template = self.template_env.get_template('error_notification')
+        self.availability_text_template = self.template_env.get_template('availability_alert.txt')
+        self.daily_summary_text_template = self.template_env.get_template('daily_summary.txt')
+        self.error_text_template = self.template_env.get_template('error_notification.txt')
+        
+        # Subject and encoded parts of recent availability alerts, keyed by their content
+        self._render_cache: OrderedDict[Tuple, Tuple[str, Tuple[MIMEText, MIMEText]]] = OrderedDict()
+        
+        # Pool of SMTP connections reused across sends, opened on demand up to
+        # alert_concurrency at once
+        self._smtp_idle: List[aiosmtplib.SMTP] = []
+        self._smtp_slots = asyncio.BoundedSemaphore(settings.alert_concurrency)
         
         # Email delivery tracking
         self.delivery_stats = {
@@ -272,6 +435,26 @@ class EmailNotificationService:
             'retries': 0
         }
     
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+    
+    async def close(self) -> None:
+        """Close the pooled SMTP connections."""
+        idle, self._smtp_idle = self._smtp_idle, []
+        for smtp in idle:
+            if not smtp.is_connected:
+                continue
+            try:
+                await smtp.quit()
+            except aiosmtplib.SMTPException as e:
+                logger.warning(f"SMTP quit failed: {e}")
+                smtp.close()
+    
     async def send_availability_alert(
         self,
         alert_rule: AlertRule,
@@ -287,55 +470,131 @@ class EmailNotificationService:
         Returns:
             NotificationRecord: Record of the notification attempt
         """
-        if not sites:
-            logger.warning("No sites provided for availability alert")
-            return self._create_notification_record(
-                alert_rule, sites[0] if sites else None, NotificationStatus.SKIPPED, 
-                "No sites to notify about"
-            )
+        records = await self.send_availability_alerts([(alert_rule, sites)])
+        return records[0]
+    
+    async def send_availability_alerts(
+        self,
+        alerts: List[Tuple[AlertRule, List[CampsiteAvailability]]]
+    ) -> List[NotificationRecord]:
+        """
+        Send availability alert emails for several alert rules at once.
         
-        try:
-            # Determine if this is weekend availability
-            is_weekend = any(site.check_in_date.weekday() >= 5 for site in sites)
-            
-            # Get park information
-            park_info = get_park_info(sites[0].park)
-            
-            # Prepare template context
-            context = {
-                'sites': sites,
-                'site_count': len(sites),
-                'park_display_name': park_info.display_name,
-                'is_weekend': is_weekend,
-                'sent_time': datetime.utcnow(),
-                'alert_rule': alert_rule
-            }
-            
-            # Render email template
-            template = self.template_env.get_template('availability_alert')
-            html_content = template.render(**context)
-            
-            # Create email message
-            subject = f"🏕️ {park_info.display_name} - {len(sites)} Campsite{'s' if len(sites) != 1 else ''} Available!"
-            if is_weekend:
-                subject = f"⚡ WEEKEND! " + subject
-            
-            # Send email
-            success = await self._send_email(
-                to_email=alert_rule.user_email,
-                subject=subject,
-                html_content=html_content
-            )
+        Alerts for the same sites are rendered once and sent as one message with
+        every recipient in the envelope.
+        
+        Args:
+            alerts: (alert rule, sites) pairs to notify about
             
-            # Create notification record
-            status = NotificationStatus.SENT if success else NotificationStatus.FAILED
-            return self._create_notification_record(alert_rule, sites[0], status)
+        Returns:
+            List of NotificationRecord, one per alert in the same order
+        """
+        records: List[Optional[NotificationRecord]] = [None] * len(alerts)
+        
+        # Group alerts by the exact sites they cover
+        groups: Dict[Tuple, List[int]] = {}
+        for index, (alert_rule, sites) in enumerate(alerts):
+            if not sites:
+                logger.warning("No sites provided for availability alert")
+                records[index] = self._create_notification_record(
+                    alert_rule, None, NotificationStatus.SKIPPED, "No sites to notify about"
+                )
+                continue
+            
+            key = tuple((site.park, site.site_id, site.check_in_date) for site in sites)
+            groups.setdefault(key, []).append(index)
+        
+        async def send_group(indexes: List[int]) -> None:
+            sites = alerts[indexes[0]][1]
+            recipients = list(dict.fromkeys(alerts[index][0].user_email for index in indexes))
+            error_message = None
+            
+            try:
+                subject, parts = self._render_availability_alert(sites)
+                
+                # Send email
+                delivered = await self._send_message(recipients, subject, parts)
+                
+            except Exception as e:
+                logger.error(f"Failed to send availability alert: {e}")
+                delivered = set()
+                error_message = str(e)
+            
+            # Create notification records
+            for index in indexes:
+                alert_rule = alerts[index][0]
+                status = (
+                    NotificationStatus.SENT if alert_rule.user_email in delivered
+                    else NotificationStatus.FAILED
+                )
+                records[index] = self._create_notification_record(
+                    alert_rule, sites[0], status, error_message
+                )
+        
+        # Send the groups concurrently; the SMTP pool bounds how many are in flight
+        await asyncio.gather(*(send_group(indexes) for indexes in groups.values()))
+        
+        return records
+    
+    def _render_availability_alert(
+        self,
+        sites: List[CampsiteAvailability]
+    ) -> Tuple[str, Tuple[MIMEText, MIMEText]]:
+        """
+        Render the subject and encoded body parts of an availability alert.
+        
+        Args:
+            sites: Available campsites to list, all from one park
             
-        except Exception as e:
-            logger.error(f"Failed to send availability alert: {e}")
-            return self._create_notification_record(
-                alert_rule, sites[0] if sites else None, NotificationStatus.FAILED, str(e)
+        Returns:
+            Tuple of (subject, (text part, HTML part))
+        """
+        # Everything the template shows; the send time is shown to the minute so
+        # repeated alerts within a minute reuse the render
+        sent_time = _now_floor_minute()
+        key = (sent_time,) + tuple(
+            (
+                site.park, site.site_id, site.site_name, site.site_type, site.check_in_date,
+                site.max_occupancy, tuple(site.amenities), site.price, site.url
             )
+            for site in sites
+        )
+        
+        cached = self._render_cache.get(key)
+        if cached is not None:
+            self._render_cache.move_to_end(key)
+            return cached
+        
+        # Determine if this is weekend availability
+        is_weekend = any(site.check_in_date.weekday() >= 5 for site in sites)
+        
+        # Get park information
+        park_info = get_park_info(sites[0].park)
+        
+        # Prepare template context
+        context = {
+            'sites': sites,
+            'site_count': len(sites),
+            'park_display_name': park_info.display_name,
+            'is_weekend': is_weekend,
+            'sent_time': sent_time
+        }
+        
+        # Render email templates
+        html_content = self.availability_template.render(**context)
+        text_content = self.availability_text_template.render(**context)
+        
+        # Create email subject
+        subject = f"🏕️ {park_info.display_name} - {len(sites)} Campsite{'s' if len(sites) != 1 else ''} Available!"
+        if is_weekend:
+            subject = f"⚡ WEEKEND! " + subject
+        
+        rendered = (subject, _build_mime_parts(html_content, text_content))
+        self._render_cache[key] = rendered
+        if len(self._render_cache) > RENDER_CACHE_SIZE:
+            self._render_cache.popitem(last=False)
+        
+        return rendered
     
     async def send_daily_summary(
         self,
@@ -356,13 +615,13 @@ class EmailNotificationService:
             # Prepare template context
             context = {
                 'summary_date': datetime.utcnow().date(),
-                'sent_time': datetime.utcnow(),
+                'sent_time': _now_floor_minute(),
                 **summary_data
             }
             
-            # Render email template
-            template = self.template_env.get_template('daily_summary')
-            html_content = template.render(**context)
+            # Render email templates
+            html_content = self.daily_summary_template.render(**context)
+            text_content = self.daily_summary_text_template.render(**context)
             
             # Send email
             subject = f"🏕️ Daily Campsite Summary - {context['summary_date'].strftime('%B %d, %Y')}"
@@ -370,7 +629,8 @@ class EmailNotificationService:
             return await self._send_email(
                 to_email=recipient_email,
                 subject=subject,
-                html_content=html_content
+                html_content=html_content,
+                text_content=text_content
             )
             
         except Exception as e:
@@ -408,9 +668,9 @@ class EmailNotificationService:
                 'traceback': traceback
             }
             
-            # Render email template
-            template = self.template_env.get_template('error_notification')
-            html_content = template.render(**context)
+            # Render email templates
+            html_content = self.error_template.render(**context)
+            text_content = self.error_text_template.render(**context)
             
             # Send email
             subject = f"🚨 Campsite Tracker Error - {component}"
@@ -418,7 +678,8 @@ class EmailNotificationService:
             return await self._send_email(
                 to_email=recipient_email,
                 subject=subject,
-                html_content=html_content
+                html_content=html_content,
+                text_content=text_content
             )
             
         except Exception as e:
@@ -451,7 +712,7 @@ class EmailNotificationService:
         to_email: str,
         subject: str,
         html_content: str,
-        text_content: Optional[str] = None
+        text_content: str
     ) -> bool:
         """
         Send email via SMTP.
@@ -460,49 +721,149 @@ class EmailNotificationService:
             to_email: Recipient email address
             subject: Email subject
             html_content: HTML email content
-            text_content: Optional plain text content
+            text_content: Plain text email content
             
         Returns:
             bool: True if successful
         """
+        parts = _build_mime_parts(html_content, text_content)
+        delivered = await self._send_message([to_email], subject, parts)
+        return bool(delivered)
+    
+    async def _send_message(
+        self,
+        recipients: List[str],
+        subject: str,
+        parts: Tuple[MIMEText, MIMEText]
+    ) -> Set[str]:
+        """
+        Send one email to one or more recipients in a single SMTP transaction.
+        
+        With several recipients they are only listed in the envelope, as with
+        Bcc, so they don't see each other's addresses.
+        
+        Args:
+            recipients: Recipient email addresses
+            subject: Email subject
+            parts: Encoded plain text and HTML parts
+            
+        Returns:
+            Set of recipients the server accepted
+        """
+        target = recipients[0] if len(recipients) == 1 else f"{len(recipients)} recipients"
+        
         try:
-            # Create message
-            message = MIMEMultipart('alternative')
-            message['From'] = self.smtp_username
-            message['To'] = to_email
-            message['Subject'] = subject
-            message['Date'] = formatdate(localtime=True)
-            
-            # Add text content (fallback)
-            if not text_content:
-                # Simple HTML to text conversion
-                import re
-                text_content = re.sub('<[^<]+?>', '', html_content)
-                text_content = re.sub(r'\s+', ' ', text_content).strip()
-            
-            text_part = MIMEText(text_content, 'plain', 'utf-8')
-            html_part = MIMEText(html_content, 'html', 'utf-8')
-            
-            message.attach(text_part)
-            message.attach(html_part)
+            to_email = recipients[0] if len(recipients) == 1 else self.smtp_username
+            message = self._build_message(to_email, subject, parts)
             
-            # Send email
-            smtp = aiosmtplib.SMTP(hostname=self.smtp_server, port=self.smtp_port)
+            # Send email over a pooled connection
+            refused = await self._deliver(message, recipients)
+            
+        except Exception as e:
+            self.delivery_stats['failed'] += len(recipients)
+            logger.error(f"Failed to send email to {target}: {e}")
+            return set()
+        
+        delivered = set(recipients).difference(refused)
+        self.delivery_stats['sent'] += len(delivered)
+        self.delivery_stats['failed'] += len(recipients) - len(delivered)
+        
+        for recipient, response in refused.items():
+            logger.error(f"Failed to send email to {recipient}: {response}")
+        if delivered:
+            logger.info(f"Email sent successfully to {target}")
+        return delivered
+    
+    def _build_message(
+        self,
+        to_email: str,
+        subject: str,
+        parts: Tuple[MIMEText, MIMEText]
+    ) -> MIMEMultipart:
+        """
+        Build a multipart email around already encoded alternatives.
+        
+        Args:
+            to_email: Address for the To header
+            subject: Email subject
+            parts: Encoded plain text and HTML parts
+            
+        Returns:
+            MIMEMultipart: Message ready to send
+        """
+        message = MIMEMultipart('alternative')
+        message['From'] = self.smtp_username
+        message['To'] = to_email
+        message['Subject'] = subject
+        message['Date'] = formatdate(localtime=True)
+        
+        for part in parts:
+            message.attach(part)
+        
+        return message
+    
+    async def _connect_smtp(self) -> aiosmtplib.SMTP:
+        """
+        Open a new SMTP connection and log in.
+        
+        Returns:
+            aiosmtplib.SMTP: Connected, authenticated client
+        """
+        smtp = aiosmtplib.SMTP(hostname=self.smtp_server, port=self.smtp_port)
+        try:
             await smtp.connect()
             await smtp.starttls()
             await smtp.login(self.smtp_username, self.smtp_password)
+        except Exception:
+            smtp.close()
+            raise
+        
+        return smtp
+    
+    async def _deliver(
+        self,
+        message: MIMEMultipart,
+        recipients: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Send a message over a pooled SMTP connection.
+        
+        Args:
+            message: Message to send
+            recipients: Envelope recipients; taken from the headers if omitted
             
-            await smtp.send_message(message)
-            await smtp.quit()
-            
-            self.delivery_stats['sent'] += 1
-            logger.info(f"Email sent successfully to {to_email}")
-            return True
+        Returns:
+            Dict of refused recipients to server responses
             
-        except Exception as e:
-            self.delivery_stats['failed'] += 1
-            logger.error(f"Failed to send email to {to_email}: {e}")
-            return False
+        Raises:
+            aiosmtplib.SMTPException: If the message could not be sent
+        """
+        async with self._smtp_slots:
+            # Reuse the most recently used idle connection, or open one
+            smtp = None
+            while self._smtp_idle and smtp is None:
+                smtp = self._smtp_idle.pop()
+                if not smtp.is_connected:
+                    smtp = None
+            if smtp is None:
+                smtp = await self._connect_smtp()
+            
+            try:
+                try:
+                    refused, _ = await smtp.send_message(message, recipients=recipients)
+                except aiosmtplib.SMTPServerDisconnected:
+                    # Servers drop idle connections between cycles; reconnect once
+                    smtp.close()
+                    self.delivery_stats['retries'] += 1
+                    smtp = await self._connect_smtp()
+                    refused, _ = await smtp.send_message(message, recipients=recipients)
+            except Exception:
+                smtp.close()
+                raise
+            
+            self._smtp_idle.append(smtp)
+        
+        return refused
     
     def _create_notification_record(
         self,
@@ -512,29 +873,37 @@ class EmailNotificationService:
         error_message: Optional[str] = None
     ) -> NotificationRecord:
         """Create a notification record for tracking."""
+        now = datetime.utcnow()
+        alert_rule_id = alert_rule.id or "unknown"
+        sent_at = now if status == NotificationStatus.SENT else None
+        
         if not site:
             # Create a dummy record for failed notifications
             return NotificationRecord(
-                alert_rule_id=alert_rule.id or "unknown",
+                alert_rule_id=alert_rule_id,
                 campsite_availability_key="unknown",
                 recipient_email=alert_rule.user_email,
-                park=list(alert_rule.parks)[0] if alert_rule.parks else "unknown",
+                park=next(iter(alert_rule.parks), "unknown"),
                 site_id="unknown",
-                check_in_date=datetime.utcnow().date(),
+                check_in_date=now.date(),
                 status=status,
-                sent_at=datetime.utcnow() if status == NotificationStatus.SENT else None,
+                sent_at=sent_at,
                 error_message=error_message
             )
         
+        park = site.park
+        site_id = site.site_id
+        check_in_date = site.check_in_date
+        
         return NotificationRecord(
-            alert_rule_id=alert_rule.id or "unknown",
-            campsite_availability_key=f"{site.park}_{site.site_id}_{site.check_in_date}",
+            alert_rule_id=alert_rule_id,
+            campsite_availability_key="_".join((park, site_id, check_in_date.isoformat())),
             recipient_email=alert_rule.user_email,
-            park=site.park,
-            site_id=site.site_id,
-            check_in_date=site.check_in_date,
+            park=park,
+            site_id=site_id,
+            check_in_date=check_in_date,
             status=status,
-            sent_at=datetime.utcnow() if status == NotificationStatus.SENT else None,
+            sent_at=sent_at,
             error_message=error_message
         )
     
@@ -0,0 +1,18 @@
+"""
+Shared pytest configuration.
+
+Provides placeholder values for the required settings so the application
+modules can be imported without a .env file.
+"""
+
+import os
+
+for name, value in {
+    'SUPABASE_PROJECT_REF': 'test-project',
+    'SUPABASE_ACCESS_TOKEN': 'test-token',
+    'NOTIFICATION_EMAIL': 'alerts@example.com',
+    'SMTP_USERNAME': 'sender@example.com',
+    'SMTP_PASSWORD': 'test-password',
+    'SECRET_KEY': 'test-secret-key-with-at-least-32-characters',
+}.items():
+    os.environ.setdefault(name, value)
@@ -0,0 +1,50 @@
+"""
+Tests for the dashboard's response cache.
+"""
+
+import pytest
+
+from src.config.parks import ParkEnum
+from src.dashboard import calendar_view
+from src.dashboard.calendar_view import DashboardAPI
+
+
+@pytest.fixture
+def dashboard():
+    return DashboardAPI()
+
+
+def test_response_cache_evicts_least_recently_used(dashboard, monkeypatch):
+    monkeypatch.setattr(calendar_view, "RESPONSE_CACHE_SIZE", 2)
+
+    dashboard._cache_set(('a',), 1, 60)
+    dashboard._cache_set(('b',), 2, 60)
+    assert dashboard._cache_get(('a',)) == 1
+    dashboard._cache_set(('c',), 3, 60)
+
+    assert list(dashboard._response_cache) == [('a',), ('c',)]
+    assert dashboard._cache_get(('b',)) is None
+
+
+def test_response_cache_drops_expired_entries_on_set(dashboard):
+    dashboard._cache_set(('stale',), 1, -1)
+    dashboard._cache_set(('fresh',), 2, 60)
+
+    assert list(dashboard._response_cache) == [('fresh',)]
+
+
+@pytest.mark.asyncio
+async def test_empty_calendar_month_is_not_cached(dashboard, monkeypatch):
+    queries = []
+
+    async def no_rows(parks, start_date, end_date):
+        queries.append((start_date, end_date))
+        return []
+
+    monkeypatch.setattr(dashboard.db_client, "get_availability_by_parks", no_rows)
+
+    for _ in range(2):
+        await dashboard.get_cached_calendar_data(2099, 6, [ParkEnum.JOSHUA_TREE])
+
+    assert len(queries) == 2
+    assert not dashboard._response_cache
@@ -0,0 +1,98 @@
+"""
+Tests for the plain text email templates.
+"""
+
+from datetime import date, datetime
+
+import pytest
+
+from src.database.models import CampsiteAvailability
+from src.notifications.email_alerts import EmailNotificationService
+
+
+SENT_TIME = datetime(2025, 6, 1, 14, 5, 42)
+
+
+@pytest.fixture
+def service():
+    return EmailNotificationService()
+
+
+def make_site(site_id="A1", check_in_date=date(2099, 6, 5), **fields):
+    return CampsiteAvailability(
+        park="joshua_tree",
+        site_id=site_id,
+        site_name=f"Site {site_id}",
+        site_type="tent",
+        check_in_date=check_in_date,
+        status="available",
+        **fields
+    )
+
+
+def test_availability_text_lists_sites_and_sends_time_to_the_minute(service):
+    sites = [
+        make_site("A1", price=35.0, amenities=["fire ring", "picnic table"], url="https://example.com/a1"),
+        make_site("B2"),
+    ]
+
+    text = service.availability_text_template.render(
+        sites=sites,
+        site_count=len(sites),
+        park_display_name="Joshua Tree",
+        is_weekend=False,
+        sent_time=SENT_TIME
+    )
+
+    assert text.startswith("Campsite Available! - Joshua Tree\n\nGreat news! We found 2 available campsites that match")
+    assert "Site A1\n  Site ID: A1\n  Type: Tent\n  Check-in: Friday, June 05, 2099\n" in text
+    assert "  Amenities: fire ring, picnic table\n  Price: $35.00 per night\n  Book now: https://example.com/a1\n" in text
+    assert "Site B2\n  Site ID: B2\n  Type: Tent\n  Check-in: Friday, June 05, 2099\n\nAct fast!" in text
+    assert "WEEKEND" not in text
+    assert "Sent at 2025-06-01 14:05 \n" in text
+
+
+def test_availability_text_single_weekend_site(service):
+    text = service.availability_text_template.render(
+        sites=[make_site(check_in_date=date(2099, 6, 6))],
+        site_count=1,
+        park_display_name="Joshua Tree",
+        is_weekend=True,
+        sent_time=SENT_TIME
+    )
+
+    assert "\n\nWEEKEND AVAILABILITY! These sites are available for weekend camping.\n\n" in text
+    assert "We found 1 available campsite that matches your alert preferences:" in text
+
+
+def test_daily_summary_text(service):
+    text = service.daily_summary_text_template.render(
+        summary_date=date(2025, 6, 1),
+        sent_time=SENT_TIME,
+        total_available=12,
+        weekend_available=3,
+        notifications_sent=2,
+        parks=[
+            {'name': "Joshua Tree", 'available_count': 10, 'weekend_count': 3, 'lowest_price': 25.0},
+            {'name': "Carlsbad", 'available_count': 2, 'weekend_count': 0, 'lowest_price': None},
+        ]
+    )
+
+    assert text.startswith("Daily Campsite Summary - Sunday, June 01, 2025\n")
+    assert "  Available sites: 12\n  Weekend available: 3\n  Alerts sent: 2\n" in text
+    assert "Joshua Tree\n  Available sites: 10\n  Weekend sites: 3\n  Lowest price: $25.00\n" in text
+    assert "Carlsbad\n  Available sites: 2\n  Weekend sites: 0\n\n--" in text
+    assert text.endswith("Generated at 2025-06-01 14:05 ")
+
+
+def test_error_text_keeps_full_precision_time(service):
+    text = service.error_text_template.render(
+        component="scraper",
+        error_type="TimeoutError",
+        error_time=SENT_TIME,
+        error_message="timed out",
+        traceback=None
+    )
+
+    assert "Component: scraper\nError Type: TimeoutError\nTime: 2025-06-01 14:05:42 \nMessage: timed out\n\n" in text
+    assert "Technical details" not in text
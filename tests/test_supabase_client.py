@@ -0,0 +1,248 @@
+"""
+Tests for the Supabase client's availability storage, row conversion and retries.
+"""
+
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+
+import asyncpg
+import pytest
+
+from src.config.parks import ParkEnum
+from src.database.models import AvailabilityStatus, CampsiteAvailability, NotificationRecord
+from src.database.supabase_client import SupabaseClient, SupabaseError
+
+
+def make_availability(site_id: str, check_in_date: date, status: str = "available", price: float = 30.0):
+    """Build an availability record for Carlsbad."""
+    return CampsiteAvailability(
+        park="carlsbad",
+        site_id=site_id,
+        site_name=f"Site {site_id}",
+        site_type="tent",
+        check_in_date=check_in_date,
+        status=status,
+        price=price
+    )
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """SupabaseClient whose MCP calls are recorded instead of sent."""
+    client = SupabaseClient()
+    client.calls = []
+    
+    async def fake_call(tool_name, parameters):
+        client.calls.append((tool_name, parameters))
+        return {'success': True}
+    
+    monkeypatch.setattr(client, "_call_mcp_tool", fake_call)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_store_availability_keeps_last_row_per_key(db):
+    day = date(2099, 6, 5)
+    await db.store_availability_data([
+        make_availability("A1", day, status="available", price=30.0),
+        make_availability("A2", day),
+        make_availability("A1", day, status="booked", price=35.0),
+    ])
+    
+    (tool_name, parameters), = db.calls
+    rows = {row['site_id']: row for row in parameters['data']}
+    
+    assert tool_name == "insert_rows"
+    assert parameters['conflict_columns'] == ["park", "site_id", "check_in_date"]
+    assert len(parameters['data']) == 2
+    assert (rows['A1']['status'], rows['A1']['price']) == ("booked", 35.0)
+
+
+@pytest.mark.asyncio
+async def test_store_availability_rewrites_unchanged_rows(db):
+    # Unchanged rows must still be upserted so scraped_at stays fresh for alerting
+    batch = [make_availability("A1", date(2099, 6, 5))]
+    
+    await db.store_availability_data(batch)
+    await db.store_availability_data(batch)
+    
+    assert [len(parameters['data']) for _, parameters in db.calls] == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_store_availability_uses_current_field_values(db):
+    original = make_availability("A1", date(2099, 6, 5), price=30.0)
+    assert original.db_row['price'] == 30.0
+    
+    copied = original.model_copy(update={'price': 20.0})
+    original.status = "booked"
+    
+    await db.store_availability_data([original])
+    await db.store_availability_data([copied])
+    
+    (_, stored_original), (_, stored_copy) = db.calls
+    assert stored_original['data'][0]['status'] == "booked"
+    assert stored_copy['data'][0]['price'] == 20.0
+
+
+@pytest.mark.asyncio
+async def test_record_notification_inserts_before_returning(db):
+    notification = NotificationRecord(
+        alert_rule_id="rule-1",
+        campsite_availability_key="joshua_tree_A1_2099-06-05",
+        recipient_email="camper@example.com",
+        park="joshua_tree",
+        site_id="A1",
+        check_in_date=date(2099, 6, 5),
+        status="sent"
+    )
+    
+    assert await db.record_notification(notification) is True
+    
+    (tool_name, parameters), = db.calls
+    assert tool_name == "insert_rows"
+    assert parameters['table'] == "notification_records"
+    assert [row['site_id'] for row in parameters['data']] == ["A1"]
+
+
+
+@pytest.mark.asyncio
+async def test_get_availability_by_park_pages_after_keyset_cursor(db):
+    await db.get_availability_by_park(
+        ParkEnum.JOSHUA_TREE,
+        start_date=date(2099, 6, 1),
+        status_filter=[AvailabilityStatus.AVAILABLE],
+        limit=100,
+        after=(date(2099, 6, 5), "A1")
+    )
+    
+    (tool_name, parameters), = db.calls
+    query = " ".join(parameters['query'].split())
+    
+    assert tool_name == "execute_query"
+    assert "AND (check_in_date, site_id) > ($4::date, $5) ORDER BY check_in_date, site_id LIMIT $6" in query
+    assert parameters['params'] == [
+        "joshua_tree", date(2099, 6, 1), ["available"], date(2099, 6, 5), "A1", 100
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_availability_by_park_first_page_has_no_cursor_condition(db):
+    await db.get_availability_by_park(ParkEnum.JOSHUA_TREE, limit=100)
+    
+    (_, parameters), = db.calls
+    
+    assert "(check_in_date, site_id) >" not in parameters['query']
+    assert parameters['params'] == ["joshua_tree", 100]
+
+
+
+@pytest.mark.asyncio
+async def test_notification_cooldown_cutoffs_are_bound_as_aware_utc(db):
+    before = datetime.now(timezone.utc)
+    
+    await db.check_notification_sent(ParkEnum.JOSHUA_TREE, "A1", date(2099, 6, 5), hours_back=6)
+    await db.check_notifications_sent_bulk([(ParkEnum.JOSHUA_TREE, "A1", date(2099, 6, 5))], hours_back=6)
+    
+    cutoffs = [db.calls[0][1]['params'][3], db.calls[1][1]['params'][0]]
+    for cutoff in cutoffs:
+        assert cutoff.utcoffset() == timedelta(0)
+        assert abs(cutoff - (before - timedelta(hours=6))) < timedelta(minutes=1)
+
+
+def make_row(scraped_at):
+    """Build an availability table row as returned by a query."""
+    return {
+        'park': "carlsbad",
+        'site_id': "A1",
+        'site_name': "Site A1",
+        'site_type': "tent",
+        'check_in_date': date(2099, 6, 5),
+        'status': "available",
+        'price': 30,
+        'max_occupancy': 6,
+        'amenities': ["water"],
+        'scraped_at': scraped_at,
+        'url': None
+    }
+
+
+@pytest.mark.parametrize("scraped_at", [
+    datetime(2027, 6, 1, 12, 30),
+    datetime(2027, 6, 1, 12, 30, tzinfo=timezone.utc),
+    datetime(2027, 6, 1, 5, 30, tzinfo=timezone(timedelta(hours=-7))),
+    "2027-06-01T12:30:00",
+    "2027-06-01T12:30:00+00:00",
+    "2027-06-01T12:30:00Z",
+])
+def test_rows_to_availability_normalizes_scraped_at_to_naive_utc(scraped_at):
+    availability, = SupabaseClient()._rows_to_availability([make_row(scraped_at)])
+    
+    assert availability.scraped_at == datetime(2027, 6, 1, 12, 30)
+    assert availability.scraped_at.tzinfo is None
+    # Must be comparable with the naive cutoffs used by alert processing
+    assert availability.scraped_at >= datetime(2027, 6, 1, 12, 30) - timedelta(hours=2)
+
+
+def test_rows_to_availability_skips_malformed_rows():
+    bad_row = make_row("not a timestamp")
+    
+    availability = SupabaseClient()._rows_to_availability([make_row("2027-06-01T12:30:00Z"), bad_row])
+    
+    assert [a.site_id for a in availability] == ["A1"]
+
+
+@pytest.mark.parametrize("error, transient", [
+    (ConnectionResetError("connection reset"), True),
+    (asyncio.TimeoutError(), True),
+    (asyncpg.exceptions.TooManyConnectionsError("too many"), True),
+    (asyncpg.exceptions.ConnectionDoesNotExistError("closed mid-query"), True),
+    (asyncpg.exceptions.UndefinedTableError("no such table"), False),
+    (SupabaseError("bad request"), False),
+    (ValueError("bad data"), False),
+])
+def test_is_transient_error(error, transient):
+    assert SupabaseClient._is_transient_error(error) is transient
+
+
+@pytest.fixture
+def flaky_db(monkeypatch):
+    """SupabaseClient whose direct query fails once before succeeding, without backoff sleeps."""
+    client = SupabaseClient()
+    client.attempts = 0
+    client.backoffs = []
+    
+    async def flaky_query(parameters):
+        client.attempts += 1
+        if client.attempts == 1:
+            raise client.first_error
+        return {'success': True, 'data': []}
+    
+    async def record_backoff(error):
+        client.backoffs.append(error)
+    
+    monkeypatch.setattr(client, "_execute_query_direct", flaky_query)
+    monkeypatch.setattr(client.rate_limiter, "handle_error", record_backoff)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_call_mcp_tool_retries_transient_failure(flaky_db):
+    flaky_db.first_error = ConnectionResetError("connection reset")
+    
+    result = await flaky_db._call_mcp_tool("execute_query", {"query": "SELECT 1", "params": []})
+    
+    assert result == {'success': True, 'data': []}
+    assert flaky_db.attempts == 2
+    assert flaky_db.backoffs == [flaky_db.first_error]
+
+
+@pytest.mark.asyncio
+async def test_call_mcp_tool_does_not_retry_permanent_failure(flaky_db):
+    flaky_db.first_error = ValueError("bad data")
+    
+    with pytest.raises(SupabaseError):
+        await flaky_db._call_mcp_tool("execute_query", {"query": "SELECT 1", "params": []})
+    
+    assert flaky_db.attempts == 1
+    assert flaky_db.backoffs == []